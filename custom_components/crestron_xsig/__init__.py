@@ -3,6 +3,7 @@ from __future__ import annotations
 
 import asyncio
 import logging
+from collections import defaultdict
 from typing import Any, Final
 
 from homeassistant.config_entries import ConfigEntry
@@ -34,7 +35,6 @@ from .const import (
     CONF_DEVICE_TYPE,
     CONF_ENTITIES,
     CONF_DEVICES,
-    CONF_REMOVED_ENTITIES,
 )
 from .server import CrestronServer
 
@@ -42,38 +42,117 @@ _LOGGER = logging.getLogger(__name__)
 
 STORAGE_VERSION = 1
 STORAGE_KEY = f"{DOMAIN}.config"
+STORAGE_SAVE_DELAY = 15  # Seconds to debounce stored config writes
 
-PLATFORMS = [
+PLATFORMS: Final = (
     Platform.LIGHT,
     Platform.SWITCH,
     Platform.COVER,
     Platform.EVENT,
     Platform.BUTTON,
     Platform.SELECT,
-]
+)
+
+# Unique ID (prefix, join key) by device type; others use the first fallback join
+_UNIQUE_ID_BUILDERS: Final = {
+    "shade": ("shade", "position_join"),
+    "thermostat": ("thermostat", "current_temp_join"),
+    "button_event": ("event", "join"),
+}
+_FALLBACK_JOIN_KEYS: Final = ("join", "brightness_join", "switch_join", "momentary_join")
+
+def _is_valid_entity_config(cfg: dict[str, Any]) -> bool:
+    """Return if an entity config has the fields needed to track it."""
+    return bool(cfg.get("name") and cfg.get("device_type"))
+
+def _derive_unique_id(entry_id: str, cfg: dict[str, Any]) -> str | None:
+    """Return the unique ID an entity config is registered under."""
+    device_type = cfg.get("device_type", "")
+    
+    # Shades, thermostats and button events use a type prefix and a fixed join
+    if (builder := _UNIQUE_ID_BUILDERS.get(device_type)) is not None:
+        prefix, join_key = builder
+        join = cfg.get(join_key)
+        return None if join is None else f"{entry_id}_{prefix}_{join}"
+    
+    # For other entities, use standard join format
+    for join_key in _FALLBACK_JOIN_KEYS:
+        if join_key in cfg:
+            # Generate unique_id based on join type
+            join_type = "a" if device_type == "light" else "d"
+            return f"{entry_id}_{join_type}{cfg[join_key]}"
+    
+    return None
+
+@callback
+def _async_entities_by_device(
+    entity_registry: er.EntityRegistry, entry_id: str
+) -> dict[str | None, list[er.RegistryEntry]]:
+    """Group the entry's registry entities by device ID in a single scan."""
+    entities_by_device: defaultdict[str | None, list[er.RegistryEntry]] = defaultdict(list)
+    for entity_entry in er.async_entries_for_config_entry(entity_registry, entry_id):
+        entities_by_device[entity_entry.device_id].append(entity_entry)
+    return entities_by_device
+
+@callback
+def _async_get_store(hass: HomeAssistant) -> Store:
+    """Return the shared Store, creating domain data on first use."""
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    if (store := domain_data.get("store")) is None:
+        store = domain_data["store"] = Store(hass, STORAGE_VERSION, STORAGE_KEY)
+    return store
+
+async def _async_get_stored_config(hass: HomeAssistant) -> dict[str, Any]:
+    """Return the stored config, loading it from disk only once."""
+    domain_data = hass.data[DOMAIN]
+    if (stored_config := domain_data.get("stored_config")) is None:
+        loaded = await domain_data["store"].async_load() or {}
+        stored_config = domain_data.setdefault("stored_config", loaded)
+    return stored_config
+
+@callback
+def _async_schedule_store_save(
+    hass: HomeAssistant, delay: float = STORAGE_SAVE_DELAY
+) -> None:
+    """Schedule a debounced write of the in-memory stored config."""
+    domain_data = hass.data[DOMAIN]
+    stored_config = domain_data["stored_config"]
+    
+    def _build_store_data() -> dict[str, Any]:
+        """Snapshot the stored config at write time."""
+        return {entry_id: dict(opts) for entry_id, opts in stored_config.items()}
+    
+    domain_data["store"].async_delay_save(_build_store_data, delay)
 
 async def async_setup(hass: HomeAssistant, config) -> bool:
     """Set up the Crestron integration."""
-    if DOMAIN not in hass.data:
-        hass.data[DOMAIN] = {}
-        
-    # Initialize storage
-    store = Store(hass, STORAGE_VERSION, STORAGE_KEY)
-    hass.data[DOMAIN]["store"] = store
+    # Initialize domain data and storage
+    _async_get_store(hass)
+
+    async def cleanup(event=None) -> None:
+        """Stop all running servers."""
+        servers = hass.data[DOMAIN].get("servers", {}).values()
+        if not servers:
+            return
+        _LOGGER.debug("Cleaning up server resources")
+        results = await asyncio.gather(
+            *(asyncio.wait_for(server.stop(), timeout=10.0) for server in servers),
+            return_exceptions=True,
+        )
+        for result in results:
+            if isinstance(result, Exception):
+                _LOGGER.error("Error during cleanup: %s", result)
+
+    hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, cleanup)
 
     return True
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up Crestron from a config entry."""
     try:
-        # Initialize domain data if not already done
-        if DOMAIN not in hass.data:
-            hass.data[DOMAIN] = {}
-        
-        # Load stored config
-        store = Store(hass, STORAGE_VERSION, STORAGE_KEY)
-        hass.data[DOMAIN]["store"] = store
-        stored_config = await store.async_load() or {}
+        # Load stored config (shared across entries)
+        _async_get_store(hass)
+        stored_config = await _async_get_stored_config(hass)
         
         # Restore stored options if available
         if entry.entry_id in stored_config:
@@ -86,25 +165,6 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         # Store device map
         hass.data[DOMAIN]["devices_map"] = {}
         
-        # Register device cleanup
-        async def cleanup_devices(event=None):
-            """Clean up devices."""
-            device_registry = dr.async_get(hass)
-            entity_registry = er.async_get(hass)
-            
-            # Remove empty devices
-            for device in dr.async_entries_for_config_entry(device_registry, entry.entry_id):
-                device_entities = er.async_entries_for_device(
-                    entity_registry,
-                    device.id
-                )
-                if not device_entities:
-                    device_registry.async_remove_device(device.id)
-        
-        entry.async_on_unload(
-            hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, cleanup_devices)
-        )
-        
         # Forward entry setup to platforms
         await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
         
@@ -130,18 +190,7 @@ async def _async_setup_server(hass: HomeAssistant, entry: ConfigEntry) -> None:
         raise HomeAssistantError("Failed to start Crestron server")
 
     hass.data[DOMAIN]["server"] = server
-
-    async def cleanup(event=None) -> None:
-        """Clean up resources."""
-        try:
-            _LOGGER.debug("Cleaning up server resources")
-            await asyncio.wait_for(server.stop(), timeout=10.0)
-        except (asyncio.TimeoutError, Exception) as err:
-            _LOGGER.error("Error during cleanup: %s", err)
-
-    entry.async_on_unload(
-        hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, cleanup)
-    )
+    hass.data[DOMAIN].setdefault("servers", {})[entry.entry_id] = server
 
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
@@ -150,48 +199,33 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         device_registry = dr.async_get(hass)
         entity_registry = er.async_get(hass)
         
-        # Track removed entities
-        removed_entities = set()
-        
         # Get configured devices
-        configured_devices = set()
-        for entity_config in entry.options.get("entities", []):
-            if "device_id" in entity_config:
-                configured_devices.add(entity_config["device_id"])
+        configured_devices = frozenset(
+            entity_config["device_id"]
+            for entity_config in entry.options.get("entities", [])
+            if "device_id" in entity_config
+        )
         
-        # Unload platforms one by one
-        unload_ok = True
-        for platform in PLATFORMS:
-            try:
-                platform_unload = await hass.config_entries.async_unload_platforms(entry, [platform])
-                if not platform_unload:
-                    _LOGGER.error("Failed to unload platform %s", platform)
-                    unload_ok = False
-            except ValueError:
-                # Platform was not loaded, skip it
-                _LOGGER.debug("Platform %s was not loaded, skipping unload", platform)
-                continue
-            except Exception as err:
-                _LOGGER.error("Error unloading platform %s: %s", platform, err)
-                unload_ok = False
+        # Unload all platforms in a single pass; the platforms unload concurrently
+        try:
+            unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
+            if not unload_ok:
+                _LOGGER.error("Failed to unload one or more platforms")
+        except Exception as err:
+            _LOGGER.error("Error unloading platforms: %s", err)
+            unload_ok = False
         
         # Clean up orphaned devices
+        entities_by_device = _async_entities_by_device(entity_registry, entry.entry_id)
         for device in dr.async_entries_for_config_entry(device_registry, entry.entry_id):
             try:
-                device_entities = er.async_entries_for_device(
-                    entity_registry,
-                    device.id
-                )
+                device_entities = entities_by_device.get(device.id)
+                device_idents = {
+                    ident[1] for ident in device.identifiers if ident[0] == DOMAIN
+                }
                 
                 # Remove device if it has no entities or is not in configured devices
-                if (
-                    not device_entities or
-                    not any(
-                        ident[1] in configured_devices
-                        for ident in device.identifiers
-                        if ident[0] == DOMAIN
-                    )
-                ):
+                if not device_entities or device_idents.isdisjoint(configured_devices):
                     _LOGGER.debug(
                         "Removing device %s (no entities or not configured)",
                         device.id
@@ -201,20 +235,9 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
             except Exception as device_err:
                 _LOGGER.error("Error processing device %s: %s", device.id, device_err)
         
-        # Store removed entities in config
-        if removed_entities:
-            try:
-                store = hass.data[DOMAIN]["store"]
-                stored_config = await store.async_load() or {}
-                entry_config = stored_config.setdefault(entry.entry_id, {})
-                entry_config[CONF_REMOVED_ENTITIES] = list(removed_entities)
-                await store.async_save(stored_config)
-            except Exception as store_err:
-                _LOGGER.error("Error storing removed entities: %s", store_err)
-        
         if unload_ok:
             # Clean up server
-            server = hass.data[DOMAIN].get("server")
+            server = hass.data[DOMAIN].get("servers", {}).pop(entry.entry_id, None)
             if server:
                 await server.stop()
             
@@ -238,100 +261,48 @@ async def async_reload_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
         # Track configured unique IDs
         configured_unique_ids = set()
         
+        # Skip entities with missing required config up front
+        valid_configs = [
+            entity_config
+            for entity_config in entry.options.get("entities", [])
+            if _is_valid_entity_config(entity_config)
+        ]
+        
         # Process entities
-        for entity_config in entry.options.get("entities", []):
-            try:
-                name = entity_config.get("name", "")
-                device_type = entity_config.get("device_type", "")
-                device_id = entity_config.get("device_id")
-                
-                # Skip entities with missing required config
-                if not name or not device_type:
-                    continue
-                
-                # Handle different entity types
-                if device_type == "shade":
-                    # For shades, use position join for unique ID
-                    join = entity_config.get("position_join")
-                    if join is not None:
-                        unique_id = f"{entry.entry_id}_shade_{join}"
-                        configured_unique_ids.add(unique_id)
-                
-                elif device_type == "thermostat":
-                    # For thermostats, use current temp join for unique ID
-                    join = entity_config.get("current_temp_join")
-                    if join is not None:
-                        unique_id = f"{entry.entry_id}_thermostat_{join}"
-                        configured_unique_ids.add(unique_id)
-                
-                elif device_type == "button_event":
-                    # For button events, use event format
-                    join = entity_config.get("join")
-                    if join is not None:
-                        unique_id = f"{entry.entry_id}_event_{join}"
-                        configured_unique_ids.add(unique_id)
-                
-                else:
-                    # For other entities, use standard join format
-                    join = None
-                    for join_key in ["join", "brightness_join", "switch_join", "momentary_join"]:
-                        if join_key in entity_config:
-                            join = entity_config[join_key]
-                            break
-                    
-                    if join is None:
-                        _LOGGER.warning(
-                            "Skipping entity %s - missing join number",
-                            name
-                        )
-                        continue
-                    
-                    # Generate unique_id based on join type
-                    join_type = "a" if device_type in ["light"] else "d"
-                    unique_id = f"{entry.entry_id}_{join_type}{join}"
-                    configured_unique_ids.add(unique_id)
-                
-                # Also track device-based unique IDs
-                if device_id:
-                    device_unique_id = f"{device_id}_{name}"
-                    configured_unique_ids.add(device_unique_id)
-                
-                _LOGGER.debug(
-                    "Tracking entity: name=%s, device_type=%s, join=%s, unique_id=%s",
-                    name,
-                    device_type,
-                    join,
-                    unique_id
-                )
-                
-            except Exception as err:
-                _LOGGER.error(
-                    "Error processing entity config: %s",
-                    err,
-                    exc_info=True
+        for entity_config in valid_configs:
+            unique_id = _derive_unique_id(entry.entry_id, entity_config)
+            if unique_id is None:
+                _LOGGER.warning(
+                    "Skipping entity %s - missing join number",
+                    entity_config["name"]
                 )
+                continue
+            configured_unique_ids.add(unique_id)
         
         # Remove unconfigured entities
-        for entity_entry in entity_entries:
-            if entity_entry.unique_id not in configured_unique_ids:
-                _LOGGER.debug(
-                    "Removing entity %s (unique_id=%s) - no longer configured",
-                    entity_entry.entity_id,
-                    entity_entry.unique_id
-                )
-                ent_reg.async_remove(entity_entry.entity_id)
+        to_remove = [
+            entity_entry.entity_id
+            for entity_entry in entity_entries
+            if entity_entry.unique_id not in configured_unique_ids
+        ]
+        for entity_id in to_remove:
+            _LOGGER.debug("Removing entity %s - no longer configured", entity_id)
+            ent_reg.async_remove(entity_id)
         
         # Store current config before reloading
-        store = hass.data[DOMAIN]["store"]
-        stored_config = await store.async_load() or {}
-        stored_config[entry.entry_id] = dict(entry.options)
-        await store.async_save(stored_config)
+        stored_config = await _async_get_stored_config(hass)
+        stored_config[entry.entry_id] = entry.options
+        _async_schedule_store_save(hass)
         
         # Reload platforms
         await hass.config_entries.async_reload(entry.entry_id)
         
     except Exception as err:
-        _LOGGER.error("Error reloading entry: %s", err, exc_info=True)
+        _LOGGER.error(
+            "Error reloading entry: %s",
+            err,
+            exc_info=_LOGGER.isEnabledFor(logging.DEBUG)
+        )
         raise
 
 async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
@@ -341,23 +312,22 @@ async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
         ent_reg = async_get(hass)
         dev_reg = dr.async_get(hass)
         
-        # Remove entities
+        # Remove entities; the registry debounces its own save across the batch
         entity_entries = async_entries_for_config_entry(ent_reg, entry.entry_id)
         for entity_entry in entity_entries:
             ent_reg.async_remove(entity_entry.entity_id)
-            _LOGGER.debug("Removed entity: %s", entity_entry.entity_id)
+        _LOGGER.debug("Removed %d entities", len(entity_entries))
             
         # Remove devices
         device_entries = dr.async_entries_for_config_entry(dev_reg, entry.entry_id)
         for device_entry in device_entries:
             dev_reg.async_remove_device(device_entry.id)
-            _LOGGER.debug("Removed device: %s", device_entry.id)
+        _LOGGER.debug("Removed %d devices", len(device_entries))
             
-        # Remove stored config
-        store = hass.data[DOMAIN]["store"]
-        stored_config = await store.async_load() or {}
+        # Remove stored config, using the in-memory copy when already loaded
+        stored_config = await _async_get_stored_config(hass)
         stored_config.pop(entry.entry_id, None)
-        await store.async_save(stored_config)
+        _async_schedule_store_save(hass, 0)
             
     except Exception as err:
         _LOGGER.error("Error removing entry: %s", err)
\ No newline at end of file
@@ -64,6 +64,9 @@ class CrestronMomentaryButton(CrestronEntity[bool], ButtonEntity):
         # Validate press duration
         self._press_duration = min(max(press_duration, MIN_PRESS_DURATION), MAX_PRESS_DURATION)
         
+        # Serialize overlapping presses of this button
+        self._press_lock = asyncio.Lock()
+        
         # Since this is output only, we don't need to wait for first value
         self._got_first_value = True
 
@@ -80,17 +83,12 @@ class CrestronMomentaryButton(CrestronEntity[bool], ButtonEntity):
             if not self.available:
                 raise HomeAssistantError(f"Cannot press {self.name} - not available")
 
-            # Send press (True)
-            await self._server.set_digital(self._join, True)
-            
-            # Wait for duration
-            await asyncio.sleep(self._press_duration)
-            
-            # Send release (False)
-            await self._server.set_digital(self._join, False)
+            # Send press; the server queues the release after the duration
+            async with self._press_lock:
+                await self._server.pulse_digital(self._join, self._press_duration)
             
             _LOGGER.debug(
-                "%s: Press completed (duration=%.3fs)",
+                "%s: Press queued (duration=%.3fs)",
                 self.name,
                 self._press_duration
             )
@@ -111,35 +109,24 @@ async def async_setup_entry(
     """Set up Crestron buttons."""
     try:
         server = hass.data[DOMAIN]["server"]
-        entities = []
+        btn_type = DEVICE_TYPE_MOMENTARY
 
         # Get configured entities from options
         entity_configs = entry.options.get("entities", [])
         
-        for entity_config in entity_configs:
-            try:
-                device_type = entity_config.get("device_type")
-                
-                # Skip if not a button
-                if device_type != DEVICE_TYPE_MOMENTARY:
-                    continue
-
-                # Create button entity
-                entity = CrestronMomentaryButton(
-                    name=entity_config.get("name", ""),
-                    server=server,
-                    join=entity_config.get("momentary_join"),
-                    device_id=entity_config.get("device_id"),
-                )
-                entities.append(entity)
-                
-            except Exception as err:
-                _LOGGER.error(
-                    "Error setting up button entity %s: %s",
-                    entity_config.get("name", "unknown"),
-                    err,
-                    exc_info=True
-                )
+        # Create button entities for momentary configs with a name and join
+        entities = [
+            CrestronMomentaryButton(
+                name=c["name"],
+                server=server,
+                join=c["momentary_join"],
+                device_id=c.get("device_id"),
+            )
+            for c in entity_configs
+            if c.get("device_type") == btn_type
+            and c.get("name")
+            and c.get("momentary_join") is not None
+        ]
 
         if entities:
             async_add_entities(entities)
@@ -2,9 +2,8 @@
 from __future__ import annotations
 
 import logging
-from typing import Any
-import asyncio
-from collections import defaultdict
+from collections.abc import Iterable
+from typing import Any, Final
 
 import voluptuous as vol
 
@@ -39,10 +38,15 @@ from .const import (
     ERROR_INVALID_JOIN,
     ERROR_JOIN_IN_USE,
     ERROR_JOIN_OUT_OF_RANGE,
-    DEVICE_TYPE_TO_PLATFORM,
 )
 from .schemas import SCHEMA_MAP, validate_join_numbers
-from .config_flow_helper import EntityHelper, DeviceHelper, ValidationHelper
+from .config_flow_helper import (
+    EntityHelper,
+    DeviceHelper,
+    ValidationHelper,
+    HelperCounts,
+    JOIN_SPECS,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -51,69 +55,132 @@ MAX_ENTITIES_PER_DEVICE: Final = 50
 MAX_DEVICES: Final = 100
 MAX_ENTITIES: Final = 500
 
+# Static form schemas
+_USER_SCHEMA: Final = vol.Schema({
+    vol.Required(CONF_PORT, default=DEFAULT_PORT): cv.port,
+})
+
+_MENU_SCHEMA: Final = vol.Schema({
+    vol.Required("next_step"): vol.In({
+        "add": "Add Entity/Device",
+        "remove": "Remove Entity/Device",
+    })
+})
+
+_ADD_SCHEMA: Final = vol.Schema({
+    vol.Required("device_type"): vol.In({
+        DEVICE_TYPE_LIGHT: "Light (Analog I/O)",
+        DEVICE_TYPE_SHADE: "Shade (Mixed I/O)",
+        DEVICE_TYPE_THERMOSTAT: "Thermostat (Mixed I/O)",
+        DEVICE_TYPE_BUTTON_EVENT: "Button Event (Digital IN)",
+        DEVICE_TYPE_SENSOR: "Sensor (Digital IN)",
+        DEVICE_TYPE_BUTTON_LED: "Button LED (Digital OUT)",
+        DEVICE_TYPE_SWITCH: "Switch (Digital I/O)",
+        DEVICE_TYPE_MOMENTARY: "Momentary (Digital OUT)",
+        MODEL_CLW_DIMUEX_P: "CLW-DIMUEX-P (Mixed I/O)",
+    }),
+})
+
+_ADD_DEVICE_SCHEMA: Final = vol.Schema({
+    vol.Required("device_type"): vol.In({
+        MODEL_CLW_DIMUEX_P: "CLW-DIMUEX-P (Keypad with Dimmer)",
+        # Add other device types here as needed
+    }),
+})
+
+# Valid join range per join type
+_JOIN_RANGES: Final = {
+    "d": (MIN_DIGITAL_JOIN, MAX_DIGITAL_JOIN),
+    "a": (MIN_ANALOG_JOIN, MAX_ANALOG_JOIN),
+}
+
 class JoinTracker:
     """Track used joins."""
 
     def __init__(self) -> None:
         """Initialize the join tracker."""
-        self.digital_joins_in = set()  # For input joins (events)
-        self.digital_joins_out = set()  # For output joins (LEDs, momentary)
+        # Digital joins by direction: "in" for events, "out" for LEDs/momentary
+        self.digital_joins: dict[str, set[int]] = {"in": set(), "out": set()}
         self.analog_joins = set()
-        self.join_owners = defaultdict(str)
+        self.join_owners: dict[tuple, str] = {}
 
     def validate_join(self, join: int, join_type: str, owner: str, direction: str = "out") -> None:
         """Validate join number."""
         # Check join range based on type
+        if (join_range := _JOIN_RANGES.get(join_type)) is None:
+            raise ValueError(ERROR_INVALID_JOIN)
+        low, high = join_range
+        if not low <= join <= high:
+            raise ValueError(ERROR_JOIN_OUT_OF_RANGE.format(low, high))
+        
         if join_type == "d":
-            if not MIN_DIGITAL_JOIN <= join <= MAX_DIGITAL_JOIN:
-                raise ValueError(ERROR_JOIN_OUT_OF_RANGE.format(MIN_DIGITAL_JOIN, MAX_DIGITAL_JOIN))
-            
             # For digital joins, check direction
-            if direction == "in":
-                if join in self.digital_joins_in:
-                    current_owner = self.join_owners[f"d{join}_in"]
-                    raise ValueError(f"Digital input join {join} already in use by {current_owner}")
-                self.digital_joins_in.add(join)
-                self.join_owners[f"d{join}_in"] = owner
-            else:  # direction == "out"
-                if join in self.digital_joins_out:
-                    current_owner = self.join_owners[f"d{join}_out"]
-                    raise ValueError(f"Digital output join {join} already in use by {current_owner}")
-                self.digital_joins_out.add(join)
-                self.join_owners[f"d{join}_out"] = owner
+            bucket = self.digital_joins[direction]
+            key = ("d", join, direction)
+            if join in bucket:
+                current_owner = self.join_owners.get(key, "<unknown>")
+                raise ValueError(f"Digital {direction} join {join} already in use by {current_owner}")
+            bucket.add(join)
+            self.join_owners[key] = owner
                 
-        elif join_type == "a":
-            if not MIN_ANALOG_JOIN <= join <= MAX_ANALOG_JOIN:
-                raise ValueError(ERROR_JOIN_OUT_OF_RANGE.format(MIN_ANALOG_JOIN, MAX_ANALOG_JOIN))
+        else:  # join_type == "a"
             if join in self.analog_joins:
-                current_owner = self.join_owners[f"a{join}"]
+                current_owner = self.join_owners.get(("a", join, None), "<unknown>")
                 raise ValueError(f"Analog join {join} already in use by {current_owner}")
             self.analog_joins.add(join)
-            self.join_owners[f"a{join}"] = owner
-        else:
-            raise ValueError(ERROR_INVALID_JOIN)
+            self.join_owners[("a", join, None)] = owner
+
+    def validate_joins(self, specs: Iterable[tuple[int, str, str, str]]) -> None:
+        """Validate and reserve several joins as (join, join_type, owner, direction).
+        
+        Either all joins are reserved or, on the first failure, none are.
+        """
+        reserved = []
+        try:
+            for join, join_type, owner, direction in specs:
+                self.validate_join(join, join_type, owner, direction)
+                reserved.append((join, join_type, direction))
+        except ValueError:
+            for join, join_type, direction in reserved:
+                self.release_join(join, join_type, direction)
+            raise
 
     def release_join(self, join: int, join_type: str, direction: str = "out") -> None:
         """Release a join number."""
         if join_type == "d":
-            if direction == "in":
-                self.digital_joins_in.discard(join)
-                self.join_owners.pop(f"d{join}_in", None)
-            else:
-                self.digital_joins_out.discard(join)
-                self.join_owners.pop(f"d{join}_out", None)
+            self.digital_joins[direction].discard(join)
+            self.join_owners.pop(("d", join, direction), None)
         elif join_type == "a":
             self.analog_joins.discard(join)
-            self.join_owners.pop(f"a{join}", None)
+            self.join_owners.pop(("a", join, None), None)
 
     def clear(self) -> None:
         """Clear all tracked joins."""
-        self.digital_joins_in.clear()
-        self.digital_joins_out.clear()
+        for bucket in self.digital_joins.values():
+            bucket.clear()
         self.analog_joins.clear()
         self.join_owners.clear()
 
 
+def _track_existing_joins(tracker: JoinTracker, entities: list[dict]) -> None:
+    """Reserve the joins already used by configured entities.
+    
+    Stops at the first conflict; the tracker only guards joins added later.
+    """
+    try:
+        for entity in entities:
+            name = entity.get("name", "")
+            device_type = entity.get("device_type", "")
+            
+            # Track joins based on device type
+            for field, join_type, suffix, direction in JOIN_SPECS.get(device_type, ()):
+                if join := entity.get(field):
+                    tracker.validate_join(join, join_type, f"{name}{suffix}", direction)
+                    
+    except Exception as err:
+        _LOGGER.debug("Error tracking existing joins: %s", err)
+
+
 class CrestronConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     """Handle a config flow for Crestron."""
 
@@ -156,9 +223,7 @@ class CrestronConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
         return self.async_show_form(
             step_id="user",
-            data_schema=vol.Schema({
-                vol.Required(CONF_PORT, default=DEFAULT_PORT): cv.port,
-            }),
+            data_schema=_USER_SCHEMA,
             errors=errors
         )
 
@@ -178,59 +243,23 @@ class CrestronOptionsFlow(config_entries.OptionsFlow):
         """Initialize options flow."""
         self.options = dict(config_entry.options)
         self._config_entry = config_entry
-        self._entity_count = len(self.options.get("entities", []))
-        self._device_count = len(self.options.get("devices", []))
+        entities = self.options.get("entities", ())
+        self._counts = HelperCounts(
+            entities=len(entities),
+            devices=len(self.options.get("devices", ())),
+        )
         self.join_tracker = JoinTracker()  # Initialize join tracker
+        self._remove_schema_cache: tuple[tuple[str, ...], vol.Schema] | None = None
         
         # Initialize helpers
-        self.entity_helper = EntityHelper(self.join_tracker, self.options, self._entity_count)
-        self.device_helper = DeviceHelper(self._config_entry, self.options, self._device_count)
-        self.validation_helper = ValidationHelper(self._entity_count, self._device_count)
+        self.entity_helper = EntityHelper(
+            self.join_tracker, self.options, self._counts, config_entry.entry_id
+        )
+        self.device_helper = DeviceHelper(self._config_entry, self.options, self._counts)
+        self.validation_helper = ValidationHelper(self._counts)
         
         # Track existing joins
-        for entity in self.options.get("entities", []):
-            try:
-                name = entity.get("name", "")
-                device_type = entity.get("device_type", "")
-                
-                # Track joins based on device type
-                if device_type == DEVICE_TYPE_LIGHT:
-                    join = entity.get("brightness_join")
-                    if join:
-                        self.join_tracker.validate_join(join, "a", name)
-                elif device_type == DEVICE_TYPE_SHADE:
-                    pos_join = entity.get("position_join")
-                    if pos_join:
-                        self.join_tracker.validate_join(pos_join, "a", f"{name} Position")
-                    closed_join = entity.get("closed_join")
-                    if closed_join:
-                        self.join_tracker.validate_join(closed_join, "d", f"{name} Closed")
-                    stop_join = entity.get("stop_join")
-                    if stop_join:
-                        self.join_tracker.validate_join(stop_join, "d", f"{name} Stop")
-                elif device_type == DEVICE_TYPE_BUTTON_EVENT:
-                    join = entity.get("join")
-                    if join:
-                        self.join_tracker.validate_join(join, "d", name, "in")  # Input
-                elif device_type == DEVICE_TYPE_BUTTON_LED:
-                    join = entity.get("join")
-                    if join:
-                        self.join_tracker.validate_join(join, "d", name, "out")  # Output
-                elif device_type == DEVICE_TYPE_SWITCH:
-                    join = entity.get("switch_join")
-                    if join:
-                        self.join_tracker.validate_join(join, "d", name)
-                elif device_type == DEVICE_TYPE_MOMENTARY:
-                    join = entity.get("momentary_join")
-                    if join:
-                        self.join_tracker.validate_join(join, "d", name, "out")  # Output
-                        
-            except Exception as err:
-                _LOGGER.debug(
-                    "Non-critical error tracking existing join for %s: %s",
-                    name,
-                    err
-                )
+        _track_existing_joins(self.join_tracker, entities)
 
     async def async_step_init(
         self, user_input: dict[str, Any] | None = None
@@ -250,28 +279,23 @@ class CrestronOptionsFlow(config_entries.OptionsFlow):
 
         return self.async_show_form(
             step_id="menu",
-            data_schema=vol.Schema({
-                vol.Required("next_step"): vol.In({
-                    "add": "Add Entity/Device",
-                    "remove": "Remove Entity/Device",
-                })
-            }),
+            data_schema=_MENU_SCHEMA,
             description_placeholders={
-                "entity_count": str(self._entity_count),
-                "device_count": str(self._device_count),
+                "entity_count": str(self._counts.entities),
+                "device_count": str(self._counts.devices),
             }
         )
 
     async def _update_entry(self) -> None:
-        """Update config entry with current options."""
-        # Update the config entry
+        """Update config entry with current options.
+        
+        The entry's update listener (async_reload_entry) prunes removed
+        entities and reloads the entry, so no reload is triggered here.
+        """
         self.hass.config_entries.async_update_entry(
             self._config_entry,
             options=self.options
         )
-        
-        # Reload the integration to apply changes immediately
-        await self.hass.config_entries.async_reload(self._config_entry.entry_id)
 
     async def async_step_add(
         self,
@@ -290,19 +314,7 @@ class CrestronOptionsFlow(config_entries.OptionsFlow):
 
         return self.async_show_form(
             step_id="add",
-            data_schema=vol.Schema({
-                vol.Required("device_type"): vol.In({
-                    DEVICE_TYPE_LIGHT: "Light (Analog I/O)",
-                    DEVICE_TYPE_SHADE: "Shade (Mixed I/O)",
-                    DEVICE_TYPE_THERMOSTAT: "Thermostat (Mixed I/O)",
-                    DEVICE_TYPE_BUTTON_EVENT: "Button Event (Digital IN)",
-                    DEVICE_TYPE_SENSOR: "Sensor (Digital IN)",
-                    DEVICE_TYPE_BUTTON_LED: "Button LED (Digital OUT)",
-                    DEVICE_TYPE_SWITCH: "Switch (Digital I/O)",
-                    DEVICE_TYPE_MOMENTARY: "Momentary (Digital OUT)",
-                    MODEL_CLW_DIMUEX_P: "CLW-DIMUEX-P (Mixed I/O)",
-                }),
-            }),
+            data_schema=_ADD_SCHEMA,
             errors=errors
         )
 
@@ -328,10 +340,6 @@ class CrestronOptionsFlow(config_entries.OptionsFlow):
                     
                     # Save options
                     await self._update_entry()
-                    
-                    # Reload affected platform
-                    if platform := DEVICE_TYPE_TO_PLATFORM.get(device_type):
-                        await self._reload_platforms({platform})
 
                 return self.async_create_entry(title="", data=self.options)
 
@@ -354,7 +362,7 @@ class CrestronOptionsFlow(config_entries.OptionsFlow):
             errors=errors,
             description_placeholders={
                 "device_type": device_type,
-                "entity_count": str(self._entity_count),
+                "entity_count": str(self._counts.entities),
                 "max_entities": str(MAX_ENTITIES),
             }
         )
@@ -375,6 +383,18 @@ class CrestronOptionsFlow(config_entries.OptionsFlow):
             self.validation_helper.validate_entity_count(total_entities)
             self.validation_helper.validate_device_count()
             
+            # Validate base join and ensure space for all buttons
+            base_join = config["button_1_join"]
+            if base_join > MAX_DIGITAL_JOIN - (button_count - 1):
+                raise ValueError(f"Base join {base_join} too high for {button_count} sequential buttons")
+            
+            # Check all sequential button joins for collisions at once
+            button_joins = range(base_join, base_join + button_count)
+            digital_joins = self.join_tracker.digital_joins
+            clash = set(button_joins) & (digital_joins["out"] | digital_joins["in"])
+            if clash:
+                raise ValueError(f"Joins {sorted(clash)} already in use")
+            
             name = config[CONF_NAME]
             
             # Create device first
@@ -385,7 +405,6 @@ class CrestronOptionsFlow(config_entries.OptionsFlow):
             }
             
             device_id, device_name = await self.device_helper.create_device(device_config)
-            platforms_to_reload = set()
             
             # Add light if configured (Analog I/O)
             if "light_join" in config:
@@ -398,34 +417,19 @@ class CrestronOptionsFlow(config_entries.OptionsFlow):
                     "entity_id": f"{device_name}_dimmer",
                 }
                 await self.entity_helper.create_entity(light_config)
-                platforms_to_reload.add("light")
-            
-            # Process buttons (Digital I/O)
-            base_join = config["button_1_join"]
             
-            # Validate base join and ensure space for all buttons
-            if base_join > MAX_DIGITAL_JOIN - (button_count - 1):
-                raise ValueError(f"Base join {base_join} too high for {button_count} sequential buttons")
-            
-            # Create buttons with sequential joins
-            for i in range(1, button_count + 1):
-                current_join = base_join + (i-1)
-                button_config = {
-                    "number": i,
-                    "join": current_join,
-                }
+            # Create buttons with sequential joins (Digital I/O)
+            create = self.entity_helper.create_button_entities
+            button_config = {"number": 0, "join": 0}
+            for i, current_join in enumerate(button_joins, 1):
+                button_config["number"] = i
+                button_config["join"] = current_join
                 # Create button event and LED entities
-                self.entity_helper.create_button_entities(device_name, button_config, device_id)
-            
-            # Add all affected platforms
-            platforms_to_reload.update({"event", "switch", "select"})
+                create(device_name, button_config, device_id)
             
             # Save options
             await self._update_entry()
             
-            # Reload all affected platforms
-            await self._reload_platforms(platforms_to_reload)
-            
         except Exception as err:
             _LOGGER.error(
                 "Error processing CLW-DIMUEX-P configuration: %s",
@@ -452,44 +456,42 @@ class CrestronOptionsFlow(config_entries.OptionsFlow):
 
         return self.async_show_form(
             step_id="add_device",
-            data_schema=vol.Schema({
-                vol.Required("device_type"): vol.In({
-                    MODEL_CLW_DIMUEX_P: "CLW-DIMUEX-P (Keypad with Dimmer)",
-                    # Add other device types here as needed
-                }),
-            }),
+            data_schema=_ADD_DEVICE_SCHEMA,
             errors=errors,
             description_placeholders={
-                "device_count": str(self._device_count),
+                "device_count": str(self._counts.devices),
                 "max_devices": str(MAX_DEVICES),
             }
         )
 
     async def async_step_remove(self, user_input=None):
         """Handle removal of entities and devices."""
+        entities = self.options.get("entities", ())
+        devices = self.options.get("devices", ())
+        
         if user_input is None:
-            # Build schema with individual checkboxes for each entity and device
-            schema = {}
-            
-            # Add devices first
-            for device in self.options.get("devices", []):
-                name = device.get("name", device["unique_id"])
-                schema[vol.Optional(f"device_{device['unique_id']}", default=False)] = bool
-            
-            # Then add entities that don't belong to a device
-            for entity in self.options.get("entities", []):
-                if not entity.get("device_id"):
-                    name = entity[CONF_NAME]
-                    schema[vol.Optional(f"entity_{name}", default=False)] = bool
+            # Checkbox keys: devices first, then entities that don't belong to a device
+            keys = tuple(
+                f"device_{device['unique_id']}" for device in devices
+            ) + tuple(
+                f"entity_{entity[CONF_NAME]}"
+                for entity in entities
+                if not entity.get("device_id")
+            )
             
-            if not schema:
+            if not keys:
                 return self.async_abort(reason="no_entities_or_devices")
             
+            # Reuse the schema while the set of removable items is unchanged
+            if self._remove_schema_cache is None or self._remove_schema_cache[0] != keys:
+                schema = vol.Schema({vol.Optional(key, default=False): bool for key in keys})
+                self._remove_schema_cache = (keys, schema)
+            
             return self.async_show_form(
                 step_id="remove",
-                data_schema=vol.Schema(schema),
+                data_schema=self._remove_schema_cache[1],
                 description_placeholders={
-                    "count": len(schema)
+                    "count": len(keys)
                 }
             )
         
@@ -498,8 +500,13 @@ class CrestronOptionsFlow(config_entries.OptionsFlow):
             entity_registry = er.async_get(self.hass)
             device_registry = dr.async_get(self.hass)
             
-            # Track what needs to be reloaded
-            platforms_to_reload = set()
+            # Index devices and entities for selection lookups (first match wins)
+            devices_by_uid = {
+                d["unique_id"]: d for d in reversed(devices)
+            }
+            entities_by_name = {
+                e[CONF_NAME]: e for e in reversed(entities)
+            }
             
             # Process selected items
             for key, selected in user_input.items():
@@ -508,12 +515,8 @@ class CrestronOptionsFlow(config_entries.OptionsFlow):
                     
                 if key.startswith("device_"):
                     # Remove device
-                    device_id = key[7:]  # Strip "device_" prefix
-                    device = next(
-                        (d for d in self.options.get("devices", [])
-                         if d["unique_id"] == device_id),
-                        None
-                    )
+                    device_id = key.removeprefix("device_")
+                    device = devices_by_uid.get(device_id)
                     if device:
                         await self.device_helper.remove_device(
                             device, 
@@ -521,81 +524,19 @@ class CrestronOptionsFlow(config_entries.OptionsFlow):
                             device_registry,
                             self.entity_helper
                         )
-                        # Add platforms for all entity types in this device
-                        for entity in self.options.get("entities", []):
-                            if entity.get("device_id") == device_id:
-                                platform = DEVICE_TYPE_TO_PLATFORM.get(
-                                    entity.get("device_type", "")
-                                )
-                                if platform:
-                                    platforms_to_reload.add(platform)
                 
                 elif key.startswith("entity_"):
                     # Remove entity
-                    entity_name = key[7:]  # Strip "entity_" prefix
-                    entity = next(
-                        (e for e in self.options.get("entities", [])
-                         if e[CONF_NAME] == entity_name),
-                        None
-                    )
+                    entity_name = key.removeprefix("entity_")
+                    entity = entities_by_name.get(entity_name)
                     if entity:
                         await self.entity_helper.remove_entity(entity, entity_registry)
-                        # Add platform for this entity type
-                        platform = DEVICE_TYPE_TO_PLATFORM.get(
-                            entity.get("device_type", "")
-                        )
-                        if platform:
-                            platforms_to_reload.add(platform)
             
             # Update entry
             await self._update_entry()
             
-            # Reload affected platforms
-            await self._reload_platforms(platforms_to_reload)
-            
-            return self.async_create_entry(title="", data={})
+            return self.async_create_entry(title="", data=self.options)
             
         except Exception as err:
-            _LOGGER.error("Error in remove step: %s", err)
+            _LOGGER.exception("Error in remove step: %s", err)
             return self.async_abort(reason="remove_failed")
-
-    async def _reload_platforms(self, platforms: set) -> None:
-        """Reload the specified platforms."""
-        try:
-            # First, ensure the platforms are loaded
-            await self.hass.config_entries.async_forward_entry_setups(
-                self._config_entry, list(platforms)
-            )
-            
-            # Then reload them
-            for platform in platforms:
-                try:
-                    # Attempt to unload the platform
-                    await self.hass.config_entries.async_unload_platforms(
-                        self._config_entry, [platform]
-                    )
-                    # Reload it
-                    await self.hass.config_entries.async_forward_entry_setups(
-                        self._config_entry, [platform]
-                    )
-                    _LOGGER.debug("Reloaded platform %s", platform)
-                except ValueError as err:
-                    # Handle case where platform was not loaded
-                    _LOGGER.debug(
-                        "Platform %s was not loaded, skipping unload: %s",
-                        platform,
-                        err
-                    )
-                except Exception as err:
-                    _LOGGER.error(
-                        "Error reloading platform %s: %s",
-                        platform,
-                        err
-                    )
-                    raise
-        except Exception as err:
-            _LOGGER.error(
-                "Error reloading platforms: %s",
-                err
-            )
-            raise
\ No newline at end of file
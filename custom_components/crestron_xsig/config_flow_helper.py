@@ -2,13 +2,14 @@
 from __future__ import annotations
 
 import logging
+from collections import defaultdict
+from dataclasses import dataclass
 from typing import Any, Final
 
 from homeassistant.const import CONF_NAME
 from homeassistant.helpers import entity_registry as er
 from homeassistant.helpers import device_registry as dr
 from homeassistant.core import HomeAssistant
-from homeassistant.const import Platform
 
 from .const import (
     DOMAIN,
@@ -29,126 +30,169 @@ MAX_ENTITIES_PER_DEVICE: Final = 50
 MAX_DEVICES: Final = 100
 MAX_ENTITIES: Final = 500
 
+# Joins tracked per device type as (field, join type, owner suffix, direction)
+JOIN_SPECS: Final = {
+    DEVICE_TYPE_LIGHT: (("brightness_join", "a", "", "out"),),
+    DEVICE_TYPE_SHADE: (
+        ("position_join", "a", " Position", "out"),
+        ("closed_join", "d", " Closed", "out"),
+        ("stop_join", "d", " Stop", "out"),
+    ),
+    DEVICE_TYPE_BUTTON_EVENT: (("join", "d", "", "in"),),
+    DEVICE_TYPE_BUTTON_LED: (("join", "d", "", "out"),),
+    DEVICE_TYPE_SWITCH: (("switch_join", "d", "", "out"),),
+    DEVICE_TYPE_MOMENTARY: (("momentary_join", "d", "", "out"),),
+}
+
+# Keys create_device always sets itself; device_config cannot override them
+_DEVICE_ENTRY_KEYS: Final = frozenset({
+    "model",
+    "name",
+    "unique_id",
+    "entry_id",
+    "manufacturer",
+    "sw_version",
+    "identifiers",
+})
+
+# Fixed fields of the two entities created per keypad button
+_BUTTON_EVENT_TEMPLATE: Final = {"device_type": DEVICE_TYPE_BUTTON_EVENT}
+_BUTTON_LED_TEMPLATE: Final = {"device_type": DEVICE_TYPE_BUTTON_LED}
+
+@dataclass(slots=True)
+class HelperCounts:
+    """Entity and device counts shared by the options flow helpers."""
+
+    entities: int
+    devices: int
+
 class EntityHelper:
     """Helper class for entity operations."""
 
-    def __init__(self, join_tracker, options: dict, entity_count: int) -> None:
+    __slots__ = (
+        "join_tracker",
+        "options",
+        "_counts",
+        "_entry_id",
+        "_entities",
+        "_entities_by_device",
+    )
+
+    def __init__(self, join_tracker, options: dict, counts: HelperCounts, entry_id: str) -> None:
         """Initialize entity helper."""
         self.join_tracker = join_tracker
         self.options = options
-        self._entity_count = entity_count
+        self._counts = counts
+        self._entry_id = entry_id
+        
+        # Own a copy of the entity list so the config entry's options stay untouched
+        self._entities: list[dict] = list(options.get("entities", ()))
+        options["entities"] = self._entities
+        
+        # Index child entities by parent device so device removal is O(children)
+        self._entities_by_device: dict[str, list[dict]] = defaultdict(list)
+        for entity in self._entities:
+            self._index_entity(entity)
+
+    def _index_entity(self, entity: dict) -> None:
+        """Add an entity to the device index if it belongs to a device."""
+        if device_id := entity.get("device_id"):
+            self._entities_by_device[device_id].append(entity)
+
+    def pop_device_entities(self, device_id: str) -> list[dict]:
+        """Remove and return all indexed entities belonging to a device."""
+        return self._entities_by_device.pop(device_id, [])
 
     def create_button_entities(self, device_name: str, button_config: dict, device_id: str) -> None:
         """Create button event and LED entities for a keypad button."""
-        try:
-            button_number = button_config["number"]
-            join = button_config["join"]
-            
-            # Validate join number
-            self.join_tracker.validate_join(join, "d", f"Button {button_number}")
-            
-            # Create button event entity (Digital IN from Crestron)
-            button_entity = {
-                "name": f"Button {button_number}",
-                "device_type": DEVICE_TYPE_BUTTON_EVENT,
-                "join": join,
-                "device_id": device_id,
-                "entity_id": f"{device_name}_button_{button_number}",
-            }
-            self.options["entities"].append(button_entity)
-            self._entity_count += 1
-            _LOGGER.debug("Added button event entity: Button %d (join=%d)", button_number, join)
-
-            # Create LED entity (Digital OUT to Crestron)
-            led_entity = {
-                "name": f"LED {button_number}",
-                "device_type": DEVICE_TYPE_BUTTON_LED,
-                "join": join,
-                "device_id": device_id,
-                "entity_id": f"{device_name}_led_{button_number}",
-            }
-            self.options["entities"].append(led_entity)
-            self._entity_count += 1
-            _LOGGER.debug("Added LED entity: LED %d (join=%d)", button_number, join)
-            
-        except Exception as err:
-            _LOGGER.error(
-                "Error creating button entities for %s button %d: %s",
-                device_name,
-                button_number,
-                err
-            )
-            raise
+        button_number = button_config["number"]
+        join = button_config["join"]
+        
+        # Validate join number
+        self.join_tracker.validate_join(join, "d", f"Button {button_number}")
+        
+        # Create button event entity (Digital IN from Crestron)
+        button_entity = _BUTTON_EVENT_TEMPLATE.copy()
+        button_entity["name"] = f"Button {button_number}"
+        button_entity["join"] = join
+        button_entity["device_id"] = device_id
+        button_entity["entity_id"] = f"{device_name}_button_{button_number}"
+        
+        # Create LED entity (Digital OUT to Crestron)
+        led_entity = _BUTTON_LED_TEMPLATE.copy()
+        led_entity["name"] = f"LED {button_number}"
+        led_entity["join"] = join
+        led_entity["device_id"] = device_id
+        led_entity["entity_id"] = f"{device_name}_led_{button_number}"
+        
+        self._entities.extend((button_entity, led_entity))
+        self._index_entity(button_entity)
+        self._index_entity(led_entity)
+        self._counts.entities += 2
+        _LOGGER.debug("Added button event entity: Button %d (join=%d)", button_number, join)
+        _LOGGER.debug("Added LED entity: LED %d (join=%d)", button_number, join)
 
-    async def remove_entity(self, entity: dict, entity_registry: er.EntityRegistry) -> None:
-        """Remove a single entity and release its joins."""
-        try:
-            name = entity[CONF_NAME]
-            device_type = entity.get("device_type", "")
-            
-            # Release joins based on device type
-            if device_type == DEVICE_TYPE_LIGHT:
-                join = entity.get("brightness_join")
-                if join:
-                    self.join_tracker.release_join(join, "a")
-            elif device_type == DEVICE_TYPE_SHADE:
-                pos_join = entity.get("position_join")
-                if pos_join:
-                    self.join_tracker.release_join(pos_join, "a")
-                closed_join = entity.get("closed_join")
-                if closed_join:
-                    self.join_tracker.release_join(closed_join, "d")
-                stop_join = entity.get("stop_join")
-                if stop_join:
-                    self.join_tracker.release_join(stop_join, "d")
-            elif device_type == DEVICE_TYPE_BUTTON_EVENT:
-                join = entity.get("join")
-                if join:
-                    self.join_tracker.release_join(join, "d", "in")
-            elif device_type == DEVICE_TYPE_BUTTON_LED:
-                join = entity.get("join")
-                if join:
-                    self.join_tracker.release_join(join, "d", "out")
-                # Also remove binding if it exists
-                binding_id = None
-                for ent_id, ent in entity_registry.entities.items():
-                    if "led_binding" in ent_id and name in ent_id:
-                        binding_id = ent_id
-                        break
-                if binding_id:
-                    entity_registry.async_remove(binding_id)
-            elif device_type == DEVICE_TYPE_SWITCH:
-                join = entity.get("switch_join")
-                if join:
-                    self.join_tracker.release_join(join, "d")
-            elif device_type == DEVICE_TYPE_MOMENTARY:
-                join = entity.get("momentary_join")
-                if join:
-                    self.join_tracker.release_join(join, "d", "out")
-            
-            # Remove the entity from registry
-            for ent_id, ent in entity_registry.entities.items():
-                if (
-                    ent.platform == DOMAIN and
-                    name in ent_id
-                ):
-                    entity_registry.async_remove(ent_id)
-                    break
-            
-            self._entity_count -= 1
-            _LOGGER.debug(
-                "Removed entity %s (type=%s)",
-                name,
-                device_type
+    async def remove_entity(
+        self,
+        entity: dict,
+        entity_registry: er.EntityRegistry,
+        registry_entries: list[er.RegistryEntry] | None = None,
+    ) -> None:
+        """Remove a single entity and release its joins.
+        
+        registry_entries narrows the registry search, e.g. to a device's entries.
+        """
+        name = entity[CONF_NAME]
+        device_type = entity.get("device_type", "")
+        
+        # Release joins based on device type
+        for field, join_type, _, direction in JOIN_SPECS.get(device_type, ()):
+            if join := entity.get(field):
+                self.join_tracker.release_join(join, join_type, direction)
+        
+        # Only registry entries owned by this config entry can match
+        if registry_entries is None:
+            registry_entries = er.async_entries_for_config_entry(
+                entity_registry, self._entry_id
             )
-            
-        except Exception as err:
-            _LOGGER.error(
-                "Error removing entity %s: %s",
-                name,
-                err
+        matches = [
+            ent.entity_id
+            for ent in registry_entries
+            if name in ent.entity_id and ent.entity_id in entity_registry.entities
+        ]
+        
+        # Also remove the LED binding if it exists
+        binding_id = None
+        if device_type == DEVICE_TYPE_BUTTON_LED:
+            binding_id = next(
+                (ent_id for ent_id in matches if "led_binding" in ent_id), None
             )
-            raise
+            if binding_id:
+                entity_registry.async_remove(binding_id)
+        
+        # Remove the entity from registry
+        for ent_id in matches:
+            if ent_id != binding_id:
+                entity_registry.async_remove(ent_id)
+                break
+        
+        # Drop from the configured entities (by identity, equal dicts may differ)
+        self._entities[:] = [
+            existing for existing in self._entities
+            if existing is not entity
+        ]
+        
+        # Drop from the device index (already gone if the device was popped)
+        if siblings := self._entities_by_device.get(entity.get("device_id")):
+            if entity in siblings:
+                siblings.remove(entity)
+        
+        self._counts.entities -= 1
+        _LOGGER.debug(
+            "Removed entity %s (type=%s)",
+            name,
+            device_type
+        )
 
     async def create_entity(self, entity_config: dict) -> None:
         """Create a single entity with validation.
@@ -162,187 +206,158 @@ class EntityHelper:
         Raises:
             ValueError: If validation fails
         """
-        try:
-            # Validate the configuration
-            validated_config = validate_join_numbers(entity_config)
-            
-            # Track joins based on device type
-            device_type = validated_config["device_type"]
-            name = validated_config.get(CONF_NAME, "")
-            
-            if device_type == DEVICE_TYPE_LIGHT:
-                join = validated_config.get("brightness_join")
-                if join:
-                    self.join_tracker.validate_join(join, "a", name)
-            elif device_type == DEVICE_TYPE_SHADE:
-                pos_join = validated_config.get("position_join")
-                if pos_join:
-                    self.join_tracker.validate_join(pos_join, "a", f"{name} Position")
-                closed_join = validated_config.get("closed_join")
-                if closed_join:
-                    self.join_tracker.validate_join(closed_join, "d", f"{name} Closed")
-                stop_join = validated_config.get("stop_join")
-                if stop_join:
-                    self.join_tracker.validate_join(stop_join, "d", f"{name} Stop")
-            elif device_type == DEVICE_TYPE_BUTTON_EVENT:
-                join = validated_config.get("join")
-                if join:
-                    self.join_tracker.validate_join(join, "d", name, "in")
-            elif device_type == DEVICE_TYPE_BUTTON_LED:
-                join = validated_config.get("join")
-                if join:
-                    self.join_tracker.validate_join(join, "d", name, "out")
-            elif device_type == DEVICE_TYPE_SWITCH:
-                join = validated_config.get("switch_join")
-                if join:
-                    self.join_tracker.validate_join(join, "d", name)
-            elif device_type == DEVICE_TYPE_MOMENTARY:
-                join = validated_config.get("momentary_join")
-                if join:
-                    self.join_tracker.validate_join(join, "d", name, "out")
-            
-            # Add the validated entity
-            if "entities" not in self.options:
-                self.options["entities"] = []
-            
-            self.options["entities"].append(validated_config)
-            self._entity_count += 1
-            
-            _LOGGER.debug(
-                "Created entity: %s (type=%s)",
-                name,
-                device_type
-            )
-            
-        except Exception as err:
-            _LOGGER.error(
-                "Error creating entity: %s",
-                err
-            )
-            raise
+        # Validate the configuration
+        validated_config = validate_join_numbers(entity_config)
+        
+        # Track joins based on device type
+        device_type = validated_config["device_type"]
+        name = validated_config.get(CONF_NAME, "")
+        
+        self.join_tracker.validate_joins(
+            (join, join_type, f"{name}{suffix}", direction)
+            for field, join_type, suffix, direction in JOIN_SPECS.get(device_type, ())
+            if (join := validated_config.get(field))
+        )
+        
+        # Add the validated entity
+        self._entities.append(validated_config)
+        self._index_entity(validated_config)
+        self._counts.entities += 1
+        
+        _LOGGER.debug(
+            "Created entity: %s (type=%s)",
+            name,
+            device_type
+        )
 
 class DeviceHelper:
     """Helper class for device operations."""
 
-    def __init__(self, config_entry, options: dict, device_count: int) -> None:
+    __slots__ = ("_config_entry", "options", "_counts", "_devices")
+
+    def __init__(self, config_entry, options: dict, counts: HelperCounts) -> None:
         """Initialize device helper."""
         self._config_entry = config_entry
         self.options = options
-        self._device_count = device_count
+        self._counts = counts
+        
+        # Own a copy of the device list so the config entry's options stay untouched
+        self._devices: list[dict] = list(options.get("devices", ()))
+        options["devices"] = self._devices
 
     async def create_device(self, device_config: dict) -> tuple[str, str]:
         """Create a device entry and return its ID and name."""
-        try:
-            name = device_config[CONF_NAME]
-            model = device_config["model"]
-            
-            # Create device unique ID
-            device_unique_id = f"{DOMAIN}_{name}_{model.lower()}"
-            
-            # Create device config
-            device_entry = {
-                "model": model,
-                "name": name,  # Original configured name
-                "unique_id": device_unique_id,
-                "entry_id": self._config_entry.entry_id,
-                "manufacturer": "Crestron",
-                "sw_version": "1.0.0",
-                "identifiers": [(DOMAIN, device_unique_id)],
-                **device_config,  # Include any additional device-specific config
-            }
-            
-            # Initialize devices list if needed
-            if "devices" not in self.options:
-                self.options["devices"] = []
-            
-            # Add device
-            self.options["devices"].append(device_entry)
-            self._device_count += 1
-            
-            _LOGGER.debug(
-                "Created device: %s (model=%s)",
-                name,
-                model
-            )
-            
-            return device_unique_id, name
-            
-        except Exception as err:
-            _LOGGER.error(
-                "Error creating device: %s",
-                err
-            )
-            raise
+        name = device_config[CONF_NAME]
+        model = device_config["model"]
+        
+        # Create device unique ID
+        device_unique_id = f"{DOMAIN}_{name}_{model.lower()}"
+        
+        # Create device config
+        device_entry = {
+            "model": model,
+            "name": name,  # Original configured name
+            "unique_id": device_unique_id,
+            "entry_id": self._config_entry.entry_id,
+            "manufacturer": "Crestron",
+            "sw_version": "1.0.0",
+            "identifiers": ((DOMAIN, device_unique_id),),
+        }
+        
+        # Include any additional device-specific config
+        for key, value in device_config.items():
+            if key not in _DEVICE_ENTRY_KEYS:
+                device_entry[key] = value
+        
+        # Add device
+        self._devices.append(device_entry)
+        self._counts.devices += 1
+        
+        _LOGGER.debug(
+            "Created device: %s (model=%s)",
+            name,
+            model
+        )
+        
+        return device_unique_id, name
 
     async def remove_device(self, device: dict, entity_registry: er.EntityRegistry, device_registry: dr.DeviceRegistry, entity_helper: EntityHelper) -> None:
         """Remove a device and all its child entities."""
-        try:
-            device_id = device["unique_id"]
-            name = device.get("name", device_id)
-            
-            # First remove all child entities from our options
-            new_entities = [
-                entity for entity in self.options["entities"]
-                if entity.get("device_id") != device_id
-            ]
-            
-            # Count removed entities
-            removed_count = len(self.options["entities"]) - len(new_entities)
-            self.options["entities"] = new_entities
-            
-            # Remove from registry
-            if device_entry := device_registry.async_get_device(
-                identifiers={(DOMAIN, device_id)}
-            ):
-                # Remove all entities belonging to this device
-                device_entities = list(er.async_entries_for_device(
-                    entity_registry,
-                    device_entry.id
-                ))
-                for entity_entry in device_entities:
-                    entity_registry.async_remove(entity_entry.entity_id)
-                
-                # Then remove the device
-                device_registry.async_remove_device(device_entry.id)
-            
-            # Release joins for all removed entities
-            for entity in self.options.get("entities", []):
-                if entity.get("device_id") == device_id:
-                    await entity_helper.remove_entity(entity, entity_registry)
-            
-            self._device_count -= 1
-            _LOGGER.debug(
-                "Removed device %s and %d child entities",
-                name,
-                removed_count
+        device_id = device["unique_id"]
+        name = device.get("name", device_id)
+        
+        # Look up child entities through the device index
+        to_remove = entity_helper.pop_device_entities(device_id)
+        
+        # Fetch the device's registry entries once for all child removals
+        device_entry = device_registry.async_get_device(
+            identifiers={(DOMAIN, device_id)}
+        )
+        device_entities = (
+            er.async_entries_for_device(
+                entity_registry,
+                device_entry.id,
+                include_disabled_entities=True,
             )
-            
-        except Exception as err:
-            _LOGGER.error(
-                "Error removing device %s: %s",
-                name,
-                err
+            if device_entry
+            else None
+        )
+        
+        # Release joins and drop each child entity from options
+        for entity in to_remove:
+            await entity_helper.remove_entity(
+                entity, entity_registry, device_entities
             )
-            raise
+        
+        # Drop the device itself from options
+        self._devices[:] = [
+            existing for existing in self._devices
+            if existing is not device
+        ]
+        
+        removed_count = len(to_remove)
+        
+        # Remove from registry
+        if device_entry:
+            # Remove any remaining entities belonging to this device
+            for entity_entry in device_entities:
+                if entity_entry.entity_id in entity_registry.entities:
+                    entity_registry.async_remove(entity_entry.entity_id)
+            
+            # Then remove the device
+            device_registry.async_remove_device(device_entry.id)
+        
+        self._counts.devices -= 1
+        _LOGGER.debug(
+            "Removed device %s and %d child entities",
+            name,
+            removed_count
+        )
 
 class ValidationHelper:
     """Helper class for validation operations."""
 
-    def __init__(self, entity_count: int, device_count: int) -> None:
+    __slots__ = ("_counts",)
+
+    def __init__(self, counts: HelperCounts) -> None:
         """Initialize validation helper."""
-        self._entity_count = entity_count
-        self._device_count = device_count
+        self._counts = counts
+
+    @property
+    def remaining_entity_budget(self) -> int:
+        """Return how many more entities can be added."""
+        return MAX_ENTITIES - self._counts.entities
 
     def validate_entity_count(self, additional_entities: int) -> None:
         """Validate that adding entities won't exceed the maximum."""
-        if self._entity_count + additional_entities > MAX_ENTITIES:
+        if additional_entities > self.remaining_entity_budget:
             raise ValueError(
                 f"Adding {additional_entities} entities would exceed maximum of {MAX_ENTITIES}"
             )
             
     def validate_device_count(self) -> None:
         """Validate that adding a device won't exceed the maximum."""
-        if self._device_count + 1 > MAX_DEVICES:
+        if self._counts.devices >= MAX_DEVICES:
             raise ValueError(
                 f"Maximum of {MAX_DEVICES} devices reached"
             ) 
\ No newline at end of file
@@ -1,4 +1,5 @@
 """Constants for the Crestron XSIG integration."""
+from types import MappingProxyType
 from typing import Final
 from homeassistant.const import Platform
 from homeassistant.components.binary_sensor import BinarySensorDeviceClass
@@ -17,11 +18,11 @@ JOIN_TYPE_DIGITAL: Final = "d"  # Digital (boolean)
 JOIN_TYPE_ANALOG: Final = "a"   # Analog (0-65535)
 JOIN_TYPE_SERIAL: Final = "s"   # Serial (string)
 
-JOIN_TYPE_OPTIONS = [
+JOIN_TYPE_OPTIONS: Final = frozenset({
     JOIN_TYPE_DIGITAL,
     JOIN_TYPE_ANALOG,
     JOIN_TYPE_SERIAL,
-]
+})
 
 # Join Limits
 MIN_DIGITAL_JOIN: Final = 1
@@ -47,7 +48,7 @@ DEVICE_TYPE_MOMENTARY: Final = "momentary"
 DEVICE_TYPE_KEYPAD: Final = "keypad"
 DEVICE_TYPE_CLW_DIMUEX: Final = "clw_dimuex"
 
-DEVICE_TYPE_OPTIONS: Final = [
+DEVICE_TYPE_OPTIONS: Final = frozenset({
     DEVICE_TYPE_LIGHT,
     DEVICE_TYPE_SHADE,
     DEVICE_TYPE_THERMOSTAT,
@@ -57,7 +58,7 @@ DEVICE_TYPE_OPTIONS: Final = [
     DEVICE_TYPE_SWITCH,
     DEVICE_TYPE_MOMENTARY,
     DEVICE_TYPE_CLW_DIMUEX,
-]
+})
 
 # Platform Lists
 PLATFORMS: Final = {
@@ -134,13 +135,13 @@ SENSOR_TYPE_WINDOW: Final = "window"
 SENSOR_TYPE_OCCUPANCY: Final = "occupancy"
 SENSOR_TYPE_PRESENCE: Final = "presence"  # Changed from CONTACT
 
-SENSOR_TYPES = {
+SENSOR_TYPES: Final = MappingProxyType({
     SENSOR_TYPE_MOTION: BinarySensorDeviceClass.MOTION,
     SENSOR_TYPE_DOOR: BinarySensorDeviceClass.DOOR,
     SENSOR_TYPE_WINDOW: BinarySensorDeviceClass.WINDOW,
     SENSOR_TYPE_OCCUPANCY: BinarySensorDeviceClass.OCCUPANCY,
     SENSOR_TYPE_PRESENCE: BinarySensorDeviceClass.PRESENCE,  # Changed from CONTACT
-}
+})
 
 # Select Entity Constants
 SELECT_DOMAIN: Final = "select"
@@ -179,38 +180,42 @@ EVENT_HOLD_DELAY: Final = 0.5  # Time in seconds to trigger hold
 EVENT_DOUBLE_PRESS_DELAY: Final = 0.3  # Max time between presses for double press
 EVENT_TRIPLE_PRESS_DELAY: Final = 0.3  # Max time between presses for triple press
 
+# Valid state sets shared by bindable domains and device classes
+_ON_OFF: Final = frozenset({"on", "off"})
+_HOME_AWAY: Final = frozenset({"home", "not_home"})
+
 # Domains that can be bound to LEDs
-BINDABLE_DOMAINS = {
-    "light": ["on", "off"],
-    "switch": ["on", "off"],
-    "binary_sensor": ["on", "off"],
-    "cover": ["open", "closed", "opening", "closing"],
-    "media_player": ["playing", "paused", "idle"],
-    "climate": ["heat", "cool", "off"],
-    "fan": ["on", "off"],
-    "lock": ["locked", "unlocked"],
-    "vacuum": ["cleaning", "docked"],
-    "person": ["home", "not_home"],
-    "device_tracker": ["home", "not_home"],
-    "input_boolean": ["on", "off"],
-}
+BINDABLE_DOMAINS: Final = MappingProxyType({
+    "light": _ON_OFF,
+    "switch": _ON_OFF,
+    "binary_sensor": _ON_OFF,
+    "cover": frozenset({"open", "closed", "opening", "closing"}),
+    "media_player": frozenset({"playing", "paused", "idle"}),
+    "climate": frozenset({"heat", "cool", "off"}),
+    "fan": _ON_OFF,
+    "lock": frozenset({"locked", "unlocked"}),
+    "vacuum": frozenset({"cleaning", "docked"}),
+    "person": _HOME_AWAY,
+    "device_tracker": _HOME_AWAY,
+    "input_boolean": _ON_OFF,
+})
 
 # Device classes that can be bound to LEDs
-BINDABLE_DEVICE_CLASSES = {
-    "motion": ["on", "off"],
-    "door": ["on", "off"],
-    "window": ["on", "off"],
-    "presence": ["on", "off"],
-    "occupancy": ["on", "off"],
-    "power": ["on", "off"],
-    "plug": ["on", "off"],
-    "light": ["on", "off"],
-    "switch": ["on", "off"],
-}
+BINDABLE_DEVICE_CLASSES: Final = MappingProxyType({
+    "motion": _ON_OFF,
+    "door": _ON_OFF,
+    "window": _ON_OFF,
+    "presence": _ON_OFF,
+    "occupancy": _ON_OFF,
+    "power": _ON_OFF,
+    "plug": _ON_OFF,
+    "light": _ON_OFF,
+    "switch": _ON_OFF,
+})
 
 # State mappings for LED binding
-STATE_TO_LED = {
-    # Generic states
+STATE_TO_LED: Final = MappingProxyType({
+    # Generic states ("off" also covers climate)
     "on": True,
     "off": False,
     
@@ -236,7 +241,6 @@ STATE_TO_LED = {
     # Climate states
     "heat": True,
     "cool": True,
-    "off": False,
     
     # Vacuum states
     "cleaning": True,
@@ -247,7 +251,7 @@ STATE_TO_LED = {
     "clear": False,
     "motion": True,
     "no_motion": False,
-}
+})
 
 # State Management Constants
 STATE_TIMEOUT: Final = 300  # 5 minutes
@@ -258,7 +262,7 @@ MAX_RETRY_ATTEMPTS: Final = 3  # Maximum number of retry attempts
 MAX_QUEUE_SIZE: Final = 100  # Maximum command queue size
 
 # Platform mapping
-DEVICE_TYPE_TO_PLATFORM = {
+DEVICE_TYPE_TO_PLATFORM: Final = MappingProxyType({
     DEVICE_TYPE_LIGHT: Platform.LIGHT,
     DEVICE_TYPE_SHADE: Platform.COVER,
     DEVICE_TYPE_BUTTON_LED: Platform.SWITCH,
@@ -266,5 +270,5 @@ DEVICE_TYPE_TO_PLATFORM = {
     DEVICE_TYPE_MOMENTARY: Platform.BUTTON,
     DEVICE_TYPE_BUTTON_EVENT: Platform.EVENT,
     MODEL_CLW_DIMUEX_P: Platform.LIGHT,  # Primary platform for the device
-}
+})
 
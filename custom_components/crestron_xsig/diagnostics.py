@@ -10,13 +10,35 @@ from homeassistant.const import CONF_PORT
 
 from .const import DOMAIN
 
-TO_REDACT = {"identifiers", "ip_address", "mac_address", "host"}
+TO_REDACT = frozenset({"identifiers", "ip_address", "mac_address", "host"})
 
 async def async_get_config_entry_diagnostics(
     hass: HomeAssistant, entry: ConfigEntry
 ) -> dict[str, Any]:
     """Return diagnostics for a config entry."""
-    server = hass.data[DOMAIN]["server"]
+    domain_data = hass.data[DOMAIN]
+    server = domain_data["server"]
+    entities_by_platform = domain_data.get("entities", {})
+    
+    entities: dict[str, list[dict[str, Any]]] = {}
+    for platform in domain_data.get("platforms", ()):
+        records = []
+        for entity in entities_by_platform.get(platform, ()):
+            # Only walk attribute dicts that have something to redact
+            attributes = entity.extra_state_attributes
+            if attributes:
+                attributes = async_redact_data(attributes, TO_REDACT)
+            records.append({
+                "name": entity.name,
+                "unique_id": entity.unique_id,
+                "available": entity.available,
+                "device_id": getattr(entity, "_device_id", None),
+                "join_type": getattr(entity, "_join_type", None),
+                "join": getattr(entity, "_join", None),
+                "state": entity.state,
+                "attributes": attributes,
+            })
+        entities[platform] = records
     
     data = {
         "entry": {
@@ -30,27 +52,8 @@ async def async_get_config_entry_diagnostics(
             "options": async_redact_data(entry.options, TO_REDACT),
         },
         "server_status": server.get_status(),
-        "entities": {
-            platform: [
-                {
-                    "name": entity.name,
-                    "unique_id": entity.unique_id,
-                    "available": entity.available,
-                    "device_id": getattr(entity, "_device_id", None),
-                    "join_type": getattr(entity, "_join_type", None),
-                    "join": getattr(entity, "_join", None),
-                    "state": entity.state,
-                    "attributes": async_redact_data(entity.extra_state_attributes, TO_REDACT),
-                }
-                for entity in hass.data[DOMAIN].get("entities", {}).get(platform, [])
-            ]
-            for platform in hass.data[DOMAIN].get("platforms", set())
-        },
-        "join_states": {
-            "digital": server._digital_states,
-            "analog": server._analog_states,
-            "serial": server._serial_states,
-        },
+        "entities": entities,
+        "join_states": server.snapshot_join_states(),
     }
 
     return data 
\ No newline at end of file
@@ -44,6 +44,10 @@ class CrestronServer(Protocol):
         """Set digital join value."""
         ...
 
+    async def pulse_digital(self, join: int, duration: float) -> None:
+        """Press digital join and release it after duration seconds."""
+        ...
+
     async def set_analog(self, join: int, value: int) -> None:
         """Set analog join value."""
         ...
@@ -1,8 +1,10 @@
 """Support for Crestron LED binding selects."""
 from __future__ import annotations
 
+import asyncio
+import heapq
 import logging
-from typing import Any
+from typing import Any, Final
 
 from homeassistant.components.select import SelectEntity
 from homeassistant.config_entries import ConfigEntry
@@ -29,6 +31,45 @@ from .entity import CrestronEntity
 
 _LOGGER = logging.getLogger(__name__)
 
+# Delay used to coalesce bursts of registry updates into one options rebuild
+OPTIONS_REBUILD_DELAY: Final = 0.25
+
+# Options every LED binding select offers
+_BASE_OPTIONS: Final = (SELECT_OPTION_NONE,)
+
+# Registry actions that can change the set of bindable entities
+_REGISTRY_ACTIONS: Final = frozenset({"create", "remove", "update"})
+
+# Bound entity states that turn the LED on
+_ACTIVE_STATES: Final = frozenset({STATE_ON, "open", "cleaning", "playing", "active", "home"})
+
+_SPACE_TO_UNDERSCORE: Final = str.maketrans(" ", "_")
+
+def _compute_ids(device_id: str | None, name: str) -> tuple[str, str, str]:
+    """Return the LED entity id, binding name and binding id for an LED."""
+    binding_name = f"{name} Binding"  # Will become "LED 1 Binding"
+    return (
+        f"switch.{device_id}_{name.lower().translate(_SPACE_TO_UNDERSCORE)}",
+        binding_name,
+        f"{device_id}_{binding_name.lower().translate(_SPACE_TO_UNDERSCORE)}",
+    )
+
+@callback
+def _async_get_bindable_index(hass: HomeAssistant) -> dict[str, tuple[str, ...]]:
+    """Return sorted enabled bindable entity ids by domain, building the index on first use."""
+    domain_data = hass.data[DOMAIN]
+    if (index := domain_data.get("bindable_index")) is None:
+        by_domain: dict[str, list[str]] = {}
+        for entity_id, entry in er.async_get(hass).entities.items():
+            if entry.domain in BINDABLE_DOMAINS and not entry.disabled:
+                by_domain.setdefault(entry.domain, []).append(entity_id)
+        index = {
+            domain: tuple(sorted(entity_ids))
+            for domain, entity_ids in by_domain.items()
+        }
+        domain_data["bindable_index"] = index
+    return index
+
 class CrestronLEDBindingSelect(CrestronEntity[str], SelectEntity):
     """Select entity for LED binding."""
 
@@ -56,9 +97,12 @@ class CrestronLEDBindingSelect(CrestronEntity[str], SelectEntity):
         self._led_entity_id = led_entity_id
         self._bound_entity_id: str | None = None
         self._cleanup_listener = None
+        self._last_led_on: bool | None = None
+        self._er: er.EntityRegistry | None = None
+        self._options_stale = False
         
         # Initialize options
-        self._attr_options = [SELECT_OPTION_NONE]
+        self._attr_options = list(_BASE_OPTIONS)
         self._attr_current_option = SELECT_OPTION_NONE
 
         # Since this is a virtual entity, we don't need to wait for first value
@@ -74,6 +118,7 @@ class CrestronLEDBindingSelect(CrestronEntity[str], SelectEntity):
     async def async_added_to_hass(self) -> None:
         """When entity is added to hass."""
         await super().async_added_to_hass()
+        self._er = er.async_get(self.hass)
         
         try:
             # Update available options
@@ -123,31 +168,37 @@ class CrestronLEDBindingSelect(CrestronEntity[str], SelectEntity):
 
     async def _setup_binding(self, entity_id: str) -> None:
         """Set up binding to an entity."""
+        # Re-selecting the current binding keeps the existing subscription
+        if entity_id == self._bound_entity_id and self._cleanup_listener is not None:
+            return
+        
+        # Clean up any existing binding
+        await self._cleanup_binding()
+        
+        if entity_id == SELECT_OPTION_NONE:
+            return
+        
+        # Set up new binding
         try:
-            # Clean up any existing binding
-            await self._cleanup_binding()
-            
-            if entity_id != SELECT_OPTION_NONE:
-                # Set up new binding
-                self._bound_entity_id = entity_id
-                self._cleanup_listener = async_track_state_change_event(
-                    self.hass,
-                    [entity_id],
-                    self._handle_bound_state_change
-                )
-                
-                # Get initial state
-                if state := self.hass.states.get(entity_id):
-                    await self._update_led_state(state.state)
-                    
+            self._cleanup_listener = async_track_state_change_event(
+                self.hass,
+                entity_id,
+                self._handle_bound_state_change
+            )
         except Exception as err:
             _LOGGER.error(
                 "Error setting up binding for %s to %s: %s",
                 self.name,
                 entity_id,
                 err,
-                exc_info=True
+                exc_info=_LOGGER.isEnabledFor(logging.DEBUG)
             )
+            return
+        self._bound_entity_id = entity_id
+        
+        # Get initial state
+        if state := self.hass.states.get(entity_id):
+            await self._update_led_state(state.state)
 
     async def _cleanup_binding(self) -> None:
         """Clean up current binding."""
@@ -158,6 +209,7 @@ class CrestronLEDBindingSelect(CrestronEntity[str], SelectEntity):
             self._cleanup_listener = None
             
             self._bound_entity_id = None
+            self._last_led_on = None
             
         except Exception as err:
             _LOGGER.error(
@@ -167,35 +219,31 @@ class CrestronLEDBindingSelect(CrestronEntity[str], SelectEntity):
                 exc_info=True
             )
 
+    @callback
+    def _invalidate_options(self) -> None:
+        """Mark the options for rebuild on the next platform flush."""
+        self._options_stale = True
+
     @callback
     def _update_options(self) -> None:
         """Update the list of available options."""
+        self._options_stale = False
         try:
-            options = [SELECT_OPTION_NONE]
+            index = _async_get_bindable_index(self.hass)
             
-            # Get entity registry
-            entity_registry = er.async_get(self.hass)
+            # Merge the pre-sorted domain lists, skipping this LED itself
+            led_entity_id = self._led_entity_id
+            options = [
+                entity_id
+                for entity_id in heapq.merge(_BASE_OPTIONS, *index.values())
+                if entity_id != led_entity_id
+            ]
             
-            # Add entities that can be bound
-            for entity_id, entry in entity_registry.entities.items():
-                # Skip if this is the LED entity itself or its binding
-                if entity_id == self._led_entity_id or "led_binding" in entity_id:
-                    continue
-                    
-                # Check if domain is bindable
-                domain = entry.domain
-                if domain not in BINDABLE_DOMAINS:
-                    continue
-                    
-                # Skip disabled entities
-                if entry.disabled:
-                    continue
-
-                # Add entity if it's in a bindable domain
-                options.append(entity_id)
-                _LOGGER.debug("Added bindable entity: %s (domain=%s)", entity_id, domain)
-                    
-            self._attr_options = sorted(options)
+            # Nothing to publish if the registry change didn't affect our options
+            if options == self._attr_options:
+                return
+            
+            self._attr_options = options
             self.async_write_ha_state()
             
             _LOGGER.debug(
@@ -205,13 +253,14 @@ class CrestronLEDBindingSelect(CrestronEntity[str], SelectEntity):
             )
             
             # Log bindable entities by domain
-            for domain in BINDABLE_DOMAINS:
-                entities = [
-                    entity_id for entity_id, entry in entity_registry.entities.items()
-                    if entry.domain == domain and not entry.disabled
-                ]
-                if entities:
-                    _LOGGER.debug("Found %s entities in domain %s: %s", len(entities), domain, entities)
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                for domain, entity_ids in index.items():
+                    _LOGGER.debug(
+                        "Found %s entities in domain %s: %s",
+                        len(entity_ids),
+                        domain,
+                        entity_ids
+                    )
             
         except Exception as err:
             _LOGGER.error(
@@ -237,56 +286,46 @@ class CrestronLEDBindingSelect(CrestronEntity[str], SelectEntity):
             )
 
     @callback
-    async def _handle_bound_state_change(self, event) -> None:
+    def _handle_bound_state_change(self, event) -> None:
         """Handle bound entity state changes."""
-        try:
-            if not self._bound_entity_id:
-                return
-            
-            new_state = event.data.get("new_state")
-            if not new_state:
-                return
-            
-            # Get state mapping
-            state = new_state.state
-            should_be_on = STATE_TO_LED.get(state, False)
-            
-            # Update LED state
-            await self.hass.services.async_call(
-                "switch",
-                "turn_on" if should_be_on else "turn_off",
-                {"entity_id": self._led_entity_id},
-                blocking=True
-            )
-            
-            _LOGGER.debug(
-                "LED binding '%s' updated LED to %s based on state '%s'",
-                self.name,
-                "on" if should_be_on else "off",
-                state
-            )
-            
-        except Exception as err:
-            _LOGGER.error(
-                "Error handling bound state change for %s: %s",
-                self.name,
-                err,
-                exc_info=True
-            )
+        if not self._bound_entity_id:
+            return
+        
+        new_state = event.data.get("new_state")
+        if not new_state:
+            return
+        
+        # Get state mapping
+        state = new_state.state
+        should_be_on = STATE_TO_LED.get(state, False)
+        
+        # Only schedule work when the LED actually has to flip
+        if should_be_on == self._last_led_on:
+            return
+        self._last_led_on = should_be_on
+        
+        # Update LED state
+        self.hass.async_create_task(self._apply_led(should_be_on))
+        
+        _LOGGER.debug(
+            "LED binding '%s' updating LED to %s based on state '%s'",
+            self.name,
+            "on" if should_be_on else "off",
+            state
+        )
 
     async def _update_led_state(self, state: str) -> None:
         """Update LED state based on bound entity state."""
         if not self._bound_entity_id:
             return
             
-        # Get entity registry to check domain and device class
-        entity_registry = er.async_get(self.hass)
-        entry = entity_registry.async_get(self._bound_entity_id)
+        # Check domain and device class in the entity registry
+        entry = self._er.async_get(self._bound_entity_id)
         if not entry:
             return
             
         # Get valid states based on domain and device class
-        valid_states = []
+        valid_states = frozenset()
         if entry.device_class and entry.device_class in BINDABLE_DEVICE_CLASSES:
             valid_states = BINDABLE_DEVICE_CLASSES[entry.device_class]
         elif entry.domain in BINDABLE_DOMAINS:
@@ -295,20 +334,42 @@ class CrestronLEDBindingSelect(CrestronEntity[str], SelectEntity):
         # Set LED state based on entity state
         if state in valid_states:
             # Turn LED on for active states
-            if state in [STATE_ON, "open", "cleaning", "playing", "active", "home"]:
-                await self.hass.services.async_call(
-                    "switch",
-                    "turn_on",
-                    {"entity_id": self._led_entity_id},
-                    blocking=True
-                )
+            should_be_on = state in _ACTIVE_STATES
+            if should_be_on == self._last_led_on:
+                return
+            
+            await self._apply_led(should_be_on)
+
+    async def _apply_led(self, should_be_on: bool) -> None:
+        """Switch the bound LED on or off."""
+        try:
+            # Drive our own LED entity directly when it is loaded
+            led = self.hass.data[DOMAIN].get("led_entities", {}).get(
+                (self._server.entry_id, self._join)
+            )
+            if led is not None:
+                if should_be_on:
+                    await led.async_turn_on()
+                else:
+                    await led.async_turn_off()
             else:
                 await self.hass.services.async_call(
                     "switch",
-                    "turn_off",
+                    "turn_on" if should_be_on else "turn_off",
                     {"entity_id": self._led_entity_id},
-                    blocking=True
+                    blocking=False
                 )
+            self._last_led_on = should_be_on
+            
+        except Exception as err:
+            # Forget the LED state so the next bound update retries
+            self._last_led_on = None
+            _LOGGER.error(
+                "Error updating LED for %s: %s",
+                self.name,
+                err,
+                exc_info=_LOGGER.isEnabledFor(logging.DEBUG)
+            )
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -329,6 +390,55 @@ async def async_setup_entry(
         if not led_configs:
             return
 
+        # Build the shared bindable entity index once for all selects
+        _async_get_bindable_index(hass)
+
+        rebuild_handle: asyncio.TimerHandle | None = None
+
+        @callback
+        def _async_rebuild_options() -> None:
+            """Rebuild binding options for invalidated selects once updates settle."""
+            nonlocal rebuild_handle
+            rebuild_handle = None
+            for select in entities:
+                if select._options_stale:
+                    select._update_options()
+
+        @callback
+        def _async_registry_updated(event) -> None:
+            """Drop the bindable entity index and schedule an options rebuild."""
+            nonlocal rebuild_handle
+            data = event.data
+            if data.get("action") not in _REGISTRY_ACTIONS:
+                return
+            
+            # Ignore entities in domains that can never be bound
+            domain = data.get("entity_id", "").split(".", 1)[0]
+            if domain not in BINDABLE_DOMAINS:
+                return
+            
+            hass.data[DOMAIN].pop("bindable_index", None)
+            for select in entities:
+                if select.hass is not None:
+                    select._invalidate_options()
+            if rebuild_handle is None:
+                rebuild_handle = hass.loop.call_later(
+                    OPTIONS_REBUILD_DELAY, _async_rebuild_options
+                )
+
+        @callback
+        def _async_cancel_rebuild() -> None:
+            """Cancel a pending options rebuild and drop the index on unload."""
+            if rebuild_handle is not None:
+                rebuild_handle.cancel()
+            # Registry changes are not tracked while unloaded, so rebuild on next setup
+            hass.data[DOMAIN].pop("bindable_index", None)
+
+        entry.async_on_unload(
+            hass.bus.async_listen(er.EVENT_ENTITY_REGISTRY_UPDATED, _async_registry_updated)
+        )
+        entry.async_on_unload(_async_cancel_rebuild)
+
         # Create binding select for each LED
         for led_config in led_configs:
             try:
@@ -339,11 +449,8 @@ async def async_setup_entry(
                 if not name or join is None:
                     continue
                 
-                # Create LED entity ID based on name and device_id
-                led_entity_id = f"switch.{device_id}_{name.lower().replace(' ', '_')}"
-                
-                # Create binding select entity with "Binding" suffix
-                binding_name = f"{name} Binding"  # Will become "LED 1 Binding"
+                # Derive LED entity ID and binding name/ID from name and device_id
+                led_entity_id, binding_name, binding_id = _compute_ids(device_id, name)
                 
                 select = CrestronLEDBindingSelect(
                     server,
@@ -351,7 +458,7 @@ async def async_setup_entry(
                     binding_name,
                     join,
                     device_id,
-                    entity_id=f"{device_id}_{binding_name.lower().replace(' ', '_')}",
+                    entity_id=binding_id,
                 )
                 entities.append(select)
                     
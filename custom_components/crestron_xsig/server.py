@@ -1,15 +1,19 @@
 """TCP Server implementation for Crestron."""
 import asyncio
+from array import array
+from itertools import count
 import struct
 import logging
-from typing import Any, Callable, Dict, Set, Final
+import socket
+import sys
+from typing import Any, Callable, Dict, Final
 from collections import defaultdict
 from datetime import datetime
 import time
-from threading import Lock
 
 from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import HomeAssistantError
+from homeassistant.util.async_ import create_eager_task
 
 from .const import (
     MAX_DIGITAL_JOIN,
@@ -26,25 +30,35 @@ _LOGGER = logging.getLogger(__name__)
 RECONNECT_DELAY: Final = 5.0  # Delay between reconnection attempts
 MAX_RECONNECT_ATTEMPTS: Final = 3  # Maximum number of reconnection attempts
 CONNECTION_TIMEOUT: Final = 10.0  # Connection timeout in seconds
-MAX_QUEUE_SIZE: Final = 100  # Maximum command queue size
-COMMAND_TIMEOUT: Final = 5.0  # Command timeout in seconds
+MAX_QUEUE_SIZE: Final = 100  # Maximum number of pending frames
+COMMAND_BATCH_WINDOW: Final = 0.01  # Window for coalescing queued frames into one write
 INITIAL_SYNC_TIMEOUT: Final = 5.0  # Timeout waiting for initial sync response
+RX_CHUNK_SIZE: Final = 8192  # Bytes requested from the stream per read
+SOCKET_BUFFER_SIZE: Final = 131072  # Kernel send/receive buffer for the control system socket
 
 # Constants for join management
 MAX_JOIN_UPDATES: Final = 1000  # Maximum number of join updates per second
 JOIN_UPDATE_WINDOW: Final = 1.0  # Time window for join update rate limiting
+RATE_GC_INTERVAL: Final = 60.0  # Interval for pruning idle rate limit entries
 MAX_CALLBACK_TIME: Final = 0.5  # Maximum time for callback execution
 
-class JoinState:
-    """Track join state and updates."""
+# Precompiled frame layouts
+_ANALOG_FRAME: Final = struct.Struct(">BBBB")
+_JOIN_HEADER: Final = struct.Struct(">BB")
 
-    def __init__(self):
-        """Initialize join state."""
-        self.value = False
-        self.last_update = 0
-        self.update_count = 0
-        self.callbacks = set()
-        self.lock = Lock()
+# Every digital frame, indexed by (join - 1) << 1 | value
+DIGITAL_FRAME_JOINS: Final = 4096  # Joins addressable by a 2-byte digital frame
+_DIGITAL_FRAMES: Final = tuple(
+    _JOIN_HEADER.pack(0b10000000 | (0 if value else 0b00100000) | join >> 7, join & 0b01111111)
+    for join in range(DIGITAL_FRAME_JOINS)
+    for value in (False, True)
+)
+
+# Interned join ids for every join a received frame can address, indexed by join
+ANALOG_FRAME_JOINS: Final = 1024  # Joins addressable by analog and serial frames
+_DIGITAL_IDS: Final = tuple(sys.intern(f"d{join}") for join in range(DIGITAL_FRAME_JOINS + 1))
+_ANALOG_IDS: Final = tuple(sys.intern(f"a{join}") for join in range(ANALOG_FRAME_JOINS + 1))
+_SERIAL_IDS: Final = tuple(sys.intern(f"s{join}") for join in range(ANALOG_FRAME_JOINS + 1))
 
 class CrestronServer:
     """Implements TCP Server for Crestron communication."""
@@ -61,28 +75,30 @@ class CrestronServer:
         self._server = None
         self._writer = None
         self._reader = None
+        self._rxbuf = bytearray()
         self._available = False
         self._reconnect_task = None
-        self._command_queue = asyncio.Queue(maxsize=MAX_QUEUE_SIZE)
+        # Frames waiting for the next batch. Analog and serial frames are keyed
+        # by join id so only the latest value is sent; digital frames get a
+        # unique sequence key so press/release edges are never collapsed.
+        self._pending: dict[str | int, bytes] = {}
+        self._frame_seq = count()
+        self._flush_event = asyncio.Event()
+        self._drained_event = asyncio.Event()
         self._command_task = None
-        self._command_lock = asyncio.Lock()
-        self._command_event = asyncio.Event()
-        
-        # Thread safety
-        self._state_lock = Lock()
-        self._callback_lock = Lock()
-        self._join_lock = Lock()
-        self._connection_lock = Lock()
+        self._rate_gc_task = None
         
         # Join state
-        self._digital = defaultdict(JoinState)
-        self._analog = defaultdict(JoinState)
-        self._serial = defaultdict(JoinState)
-        self._join_update_times = defaultdict(list)
+        self._digital: array
+        self._analog: array
+        self._serial: dict[int, str]
+        self._reset_join_states()
+        self._rate_state: dict[str, tuple[float, float]] = {}
         
         # Callback management
-        self._join_callbacks: Dict[str, set[Callable]] = defaultdict(set)
-        self._global_callbacks: Set[Callable] = set()
+        # Callback -> is coroutine function, resolved once at registration
+        self._join_callbacks: Dict[str, dict[Callable, bool]] = defaultdict(dict)
+        self._global_callbacks: dict[Callable, bool] = {}
         self._callback_tasks = set()
         self._sync_all_joins_callback = None
 
@@ -94,13 +110,11 @@ class CrestronServer:
     @property
     def available(self) -> bool:
         """Return if server is available."""
-        with self._state_lock:
-            is_available = (
-                self._available and
-                self._writer is not None and
-                not self._writer.is_closing()
-            )
-            return is_available
+        return (
+            self._available and
+            self._writer is not None and
+            not self._writer.is_closing()
+        )
 
     @property
     def entry_id(self) -> str | None:
@@ -122,59 +136,59 @@ class CrestronServer:
 
     def _validate_join(self, join: int, join_type: str) -> None:
         """Validate join number."""
-        if join_type == "d" and not 0 < join <= MAX_DIGITAL_JOIN:
-            raise ValueError(f"{ERROR_INVALID_JOIN}: Digital join {join} exceeds maximum {MAX_DIGITAL_JOIN}")
+        if join_type == "d" and not 0 < join <= min(MAX_DIGITAL_JOIN, DIGITAL_FRAME_JOINS):
+            raise ValueError(
+                f"{ERROR_INVALID_JOIN}: Digital join {join} exceeds maximum "
+                f"{min(MAX_DIGITAL_JOIN, DIGITAL_FRAME_JOINS)}"
+            )
         elif join_type == "a" and not 0 < join <= MAX_ANALOG_JOIN:
             raise ValueError(f"{ERROR_INVALID_JOIN}: Analog join {join} exceeds maximum {MAX_ANALOG_JOIN}")
 
     def _check_rate_limit(self, join_id: str) -> bool:
-        """Check if join updates are within rate limit."""
-        with self._join_lock:
-            now = time.time()
-            updates = self._join_update_times[join_id]
+        """Check if join updates are within rate limit (token bucket)."""
+        now = time.monotonic()
+        tokens, last = self._rate_state.get(join_id, (MAX_JOIN_UPDATES, now))
+        
+        # Refill for the time elapsed since the last update
+        tokens = min(
+            MAX_JOIN_UPDATES,
+            tokens + (now - last) * MAX_JOIN_UPDATES / JOIN_UPDATE_WINDOW,
+        )
+        if tokens < 1:
+            return False
             
-            # Remove old updates
-            while updates and now - updates[0] > JOIN_UPDATE_WINDOW:
-                updates.pop(0)
-                
-            # Check rate limit
-            if len(updates) >= MAX_JOIN_UPDATES:
-                return False
-                
-            updates.append(now)
-            return True
+        self._rate_state[join_id] = (tokens - 1, now)
+        return True
 
     async def start(self) -> bool:
         """Start TCP server."""
         try:
-            with self._connection_lock:
-                # Clean up any existing server
-                if self._server:
-                    await self.stop()
-                    
-                # Create new server with socket reuse
-                self._server = await asyncio.start_server(
-                    self.handle_connection,
-                    "0.0.0.0",
-                    self._port,
-                    reuse_address=True,
-                    reuse_port=True,
-                )
-                addr = self._server.sockets[0].getsockname()
-                _LOGGER.info(f"Listening on {addr}:{self._port}")
-                
-                # Reset state
-                with self._state_lock:
-                    self._available = False
-                    self._command_event.clear()
-                
-                # Start tasks
-                self._command_task = asyncio.create_task(self._process_command_queue())
-                
-                # Start serving
-                asyncio.create_task(self._server.serve_forever())
-                return True
+            # Clean up any existing server
+            if self._server:
+                await self.stop()
                 
+            # Create new server with socket reuse
+            self._server = await asyncio.start_server(
+                self.handle_connection,
+                "0.0.0.0",
+                self._port,
+                reuse_address=True,
+                reuse_port=True,
+            )
+            addr = self._server.sockets[0].getsockname()
+            _LOGGER.info(f"Listening on {addr}:{self._port}")
+            
+            # Reset state
+            self._available = False
+            
+            # Start tasks
+            self._command_task = asyncio.create_task(self._process_command_queue())
+            self._rate_gc_task = asyncio.create_task(self._prune_rate_state())
+            
+            # Start serving
+            asyncio.create_task(self._server.serve_forever())
+            return True
+            
         except Exception as err:
             _LOGGER.error(f"Failed to start server: {err}")
             return False
@@ -182,109 +196,141 @@ class CrestronServer:
     async def stop(self):
         """Stop TCP server."""
         try:
-            with self._connection_lock:
-                # First notify all callbacks about disconnection
-                with self._state_lock:
-                    self._available = False
-                    self._command_event.clear()
-                await self._notify_callbacks("system", "disconnected")
-                
-                # Cancel tasks
-                if self._command_task and not self._command_task.done():
-                    self._command_task.cancel()
-                if self._reconnect_task and not self._reconnect_task.done():
-                    self._reconnect_task.cancel()
-                    
-                # Wait for tasks to complete
-                tasks = []
-                if self._command_task:
-                    tasks.append(self._command_task)
-                if self._reconnect_task:
-                    tasks.append(self._reconnect_task)
-                if tasks:
-                    await asyncio.gather(*tasks, return_exceptions=True)
+            # First notify all callbacks about disconnection
+            self._available = False
+            await self._notify_callbacks("system", "disconnected")
+            
+            # Cancel tasks
+            if self._command_task and not self._command_task.done():
+                self._command_task.cancel()
+            if self._rate_gc_task and not self._rate_gc_task.done():
+                self._rate_gc_task.cancel()
+            if self._reconnect_task and not self._reconnect_task.done():
+                self._reconnect_task.cancel()
                 
-                # Close writer if it exists
-                if self._writer:
-                    try:
-                        self._writer.close()
-                        await asyncio.wait_for(self._writer.wait_closed(), timeout=5.0)
-                    except (asyncio.TimeoutError, Exception) as err:
-                        _LOGGER.error("Error closing writer: %s", err)
-                    self._writer = None
-
-                # Close server if it exists  
-                if self._server:
-                    try:
-                        self._server.close()
-                        await asyncio.wait_for(self._server.wait_closed(), timeout=5.0)
-                    except (asyncio.TimeoutError, Exception) as err:
-                        _LOGGER.error("Error closing server: %s", err)
-                    self._server = None
-
-                # Clear state
-                with self._state_lock:
-                    self._command_queue = asyncio.Queue(maxsize=MAX_QUEUE_SIZE)
-                    
-                with self._join_lock:
-                    self._digital.clear()
-                    self._analog.clear()
-                    self._serial.clear()
-                    self._join_update_times.clear()
-                    
-                with self._callback_lock:
-                    self._callback_tasks.clear()
+            # Wait for tasks to complete
+            tasks = []
+            if self._command_task:
+                tasks.append(self._command_task)
+            if self._rate_gc_task:
+                tasks.append(self._rate_gc_task)
+            if self._reconnect_task:
+                tasks.append(self._reconnect_task)
+            if tasks:
+                await asyncio.gather(*tasks, return_exceptions=True)
+            
+            # Close writer if it exists
+            if self._writer:
+                try:
+                    self._writer.close()
+                    await asyncio.wait_for(self._writer.wait_closed(), timeout=5.0)
+                except (asyncio.TimeoutError, Exception) as err:
+                    _LOGGER.error("Error closing writer: %s", err)
+                self._writer = None
 
-                _LOGGER.info("Server stopped")
-                
-                # Add a small delay to ensure socket is released
-                await asyncio.sleep(1)
-                
+            # Close server if it exists  
+            if self._server:
+                try:
+                    self._server.close()
+                    await asyncio.wait_for(self._server.wait_closed(), timeout=5.0)
+                except (asyncio.TimeoutError, Exception) as err:
+                    _LOGGER.error("Error closing server: %s", err)
+                self._server = None
+
+            # Clear state
+            self._pending.clear()
+            self._flush_event.clear()
+            self._signal_drained()
+            
+            self._reset_join_states()
+            self._rate_state.clear()
+            
+            self._callback_tasks.clear()
+
+            _LOGGER.info("Server stopped")
+            
+            # Add a small delay to ensure socket is released
+            await asyncio.sleep(1)
+            
         except Exception as err:
             _LOGGER.error("Error stopping server: %s", err)
         finally:
             # Ensure these are cleared even if there were errors
-            with self._state_lock:
-                self._writer = None
-                self._reader = None
-                self._server = None
-                self._command_task = None
-                self._reconnect_task = None
+            self._writer = None
+            self._reader = None
+            self._server = None
+            self._command_task = None
+            self._rate_gc_task = None
+            self._reconnect_task = None
+
+    async def _prune_rate_state(self) -> None:
+        """Periodically drop rate limit entries whose bucket has refilled."""
+        while True:
+            await asyncio.sleep(RATE_GC_INTERVAL)
+            # An entry idle for a full window is back at capacity, same as absent
+            cutoff = time.monotonic() - JOIN_UPDATE_WINDOW
+            self._rate_state = {
+                join_id: state
+                for join_id, state in self._rate_state.items()
+                if state[1] > cutoff
+            }
+
+    async def _queue_frame(self, key: str | int, frame: bytes) -> None:
+        """Add a frame to the next batch, waiting for a flush while it is full."""
+        while len(self._pending) >= MAX_QUEUE_SIZE and key not in self._pending:
+            await self._drained_event.wait()
+        self._put_frame(key, frame)
+
+    def _put_frame(self, key: str | int, frame: bytes) -> None:
+        """Append a frame to the next batch, superseding any pending frame for key."""
+        # Re-insert so a superseding value keeps its place behind earlier frames
+        self._pending.pop(key, None)
+        self._pending[key] = frame
+        self._flush_event.set()
+
+    def _signal_drained(self) -> None:
+        """Wake producers waiting for room in the pending batch."""
+        # Waiters are resolved by set(); clearing straight away re-arms the
+        # event for the next full batch without un-waking them.
+        self._drained_event.set()
+        self._drained_event.clear()
 
     async def _process_command_queue(self):
-        """Process commands from the queue."""
+        """Send pending frames, coalescing each batch window into one write."""
+        pending = self._pending
         while True:
             try:
-                # Wait for server to be available
-                if not self.available:
-                    await self._command_event.wait()
+                # Wait for the first frame; set_* only queue while available
+                await self._flush_event.wait()
                 
-                # Get command from queue
-                try:
-                    command = await asyncio.wait_for(
-                        self._command_queue.get(),
-                        timeout=COMMAND_TIMEOUT
-                    )
-                except asyncio.TimeoutError:
+                # Give bulk updates a moment to land, then take everything pending
+                await asyncio.sleep(COMMAND_BATCH_WINDOW)
+                self._flush_event.clear()
+                frames = list(pending.values())
+                pending.clear()
+                self._signal_drained()
+                if not frames:
                     continue
                 
                 if not self.available:
-                    _LOGGER.debug("Skipping command, server not available")
-                    self._command_queue.task_done()
+                    _LOGGER.debug("Skipping %d frames, server not available", len(frames))
                     continue
                     
-                async with self._command_lock:
-                    try:
-                        await command()
-                    except Exception as err:
-                        _LOGGER.error("Error processing command: %s", err)
-                        # Connection error, mark as unavailable
-                        if self._available:
-                            self._available = False
-                            self._command_event.clear()
-                            await self._notify_callbacks("system", "disconnected")
-                        
-                self._command_queue.task_done()
+                # This task is the only writer once the connection is up; the
+                # sync requests in handle_connection are whole frames written
+                # from the same loop, so no lock is needed around the writer.
+                try:
+                    data = b"".join(frames)
+                    self._writer.write(data)
+                    await self._writer.drain()
+                    if _LOGGER.isEnabledFor(logging.DEBUG):
+                        _LOGGER.debug("Sent %d frames (%d bytes)", len(frames), len(data))
+                except Exception as err:
+                    _LOGGER.error("Error processing command: %s", err)
+                    # Connection error, mark as unavailable
+                    if self._available:
+                        self._available = False
+                        await self._notify_callbacks("system", "disconnected")
                 
             except asyncio.CancelledError:
                 break
@@ -299,6 +345,7 @@ class CrestronServer:
             self._reader = reader
             peer = writer.get_extra_info("peername")
             _LOGGER.info(f"Control system connection from {peer}")
+            self._tune_socket(writer.get_extra_info("socket"))
             
             # Reset sync state
             self._initial_sync_received = False
@@ -306,9 +353,8 @@ class CrestronServer:
             self._last_sync_request = 0
             
             # Clear existing state
-            self._digital.clear()
-            self._analog.clear()
-            self._serial.clear()
+            self._rxbuf.clear()
+            self._reset_join_states()
             
             # Send initial update request
             writer.write(CMD_UPDATE_REQUEST)
@@ -318,152 +364,90 @@ class CrestronServer:
             connected = True
             while connected:
                 try:
-                    data = await reader.read(1)
-                    if data:
-                        # Sync all joins request/response
-                        if data[0] == 0xFB:
-                            # Debounce sync requests
-                            current_time = time.time()
-                            if current_time - self._last_sync_request > 0.1:  # 100ms debounce
-                                self._last_sync_request = current_time
-                                
-                                # If this is first sync after connection
-                                if not self._initial_sync_received:
-                                    _LOGGER.debug("Received initial sync response")
-                                    self._initial_sync_received = True
-                                    self._initial_sync_event.set()
+                    chunk = await reader.read(RX_CHUNK_SIZE)
+                    if chunk:
+                        self._rxbuf += chunk
+                        # Resolve the log level once per read, not per frame
+                        debug = _LOGGER.isEnabledFor(logging.DEBUG)
+                        for join_type, join, value in self._parse_frames():
+                            # Sync all joins request/response
+                            if join_type == "sync":
+                                # Debounce sync requests
+                                current_time = time.time()
+                                if current_time - self._last_sync_request > 0.1:  # 100ms debounce
+                                    self._last_sync_request = current_time
                                     
-                                    # Now mark as available and notify
-                                    self._available = True
-                                    self._command_event.set()
-                                    await self._notify_callbacks("system", "connected")
-                                    _LOGGER.debug("Server marked as available after initial sync")
+                                    # If this is first sync after connection
+                                    if not self._initial_sync_received:
+                                        _LOGGER.debug("Received initial sync response")
+                                        self._initial_sync_received = True
+                                        self._initial_sync_event.set()
+                                        
+                                        # Now mark as available and notify
+                                        self._available = True
+                                        await self._notify_callbacks("system", "connected")
+                                        _LOGGER.debug("Server marked as available after initial sync")
+                                        
+                                        # Request all joins again to ensure we have latest state
+                                        writer.write(CMD_UPDATE_REQUEST)
+                                        await writer.drain()
+                                        _LOGGER.debug("Sent follow-up sync request")
+                                    
+                                    # Call sync callback if registered
+                                    if self._sync_all_joins_callback is not None:
+                                        await self._sync_all_joins_callback()
                                     
-                                    # Request all joins again to ensure we have latest state
-                                    writer.write(CMD_UPDATE_REQUEST)
-                                    await writer.drain()
-                                    _LOGGER.debug("Sent follow-up sync request")
-                                
-                                # Call sync callback if registered
-                                if self._sync_all_joins_callback is not None:
-                                    await self._sync_all_joins_callback()
-                                
-                        else:
-                            data += await reader.read(1)
                             # Digital Join
-                            if (
-                                data[0] & 0b11000000 == 0b10000000
-                                and data[1] & 0b10000000 == 0b00000000
-                            ):
-                                header = struct.unpack("BB", data)
-                                join = ((header[0] & 0b00011111) << 7 | header[1]) + 1
-                                value = ~header[0] >> 5 & 0b1
-                                
-                                _LOGGER.debug(
-                                    "Raw digital packet received: bytes=%02x %02x, join=%d, value=%d",
-                                    data[0],
-                                    data[1],
-                                    join,
-                                    value
-                                )
-                                
-                                # Convert to bool and get join state
-                                current_bool = value == 1
-                                join_state = self._digital[join]
-                                join_id = f"d{join}"
-                                
-                                _LOGGER.debug(
-                                    "Processing digital packet - join: %d, join_id: %s, current_bool: %s, stored_value: %s, initial_sync: %s",
-                                    join,
-                                    join_id,
-                                    current_bool,
-                                    join_state.value,
-                                    self._initial_sync_received
-                                )
-                                
-                                # Update state and notify
-                                old_value = join_state.value
-                                join_state.value = current_bool
-                                join_state.last_update = time.time()
-                                join_state.update_count += 1
-                                
-                                _LOGGER.debug(
-                                    "Digital value changed - join: %d, join_id: %s, value: %s -> %s",
-                                    join,
-                                    join_id,
-                                    old_value,
-                                    current_bool
-                                )
+                            elif join_type == "d":
+                                # Once the initial sync is in, only transitions are notified
+                                old_value = self._digital[join]
+                                if old_value == value and self._initial_sync_received:
+                                    continue
+                                self._digital[join] = value
+                                join_id = _DIGITAL_IDS[join]
                                 
                                 # Send value as string "1" or "0" for consistency
-                                _LOGGER.debug(
-                                    "Notifying callbacks for %s with value %s",
-                                    join_id,
-                                    "1" if current_bool else "0"
-                                )
+                                await self._notify_callbacks(join_id, "1" if value else "0")
                                 
-                                await self._notify_callbacks(join_id, "1" if current_bool else "0")
-                                
-                                _LOGGER.debug(
-                                    "Processed digital value: join=%d, value=%s, callbacks_notified=%d",
-                                    join,
-                                    current_bool,
-                                    len(self._join_callbacks.get(join_id, set()))
-                                )
+                                if debug:
+                                    _LOGGER.debug(
+                                        "Received digital value: join=%d, value: %s -> %s, callbacks=%d, initial_sync=%s",
+                                        join,
+                                        bool(old_value),
+                                        bool(value),
+                                        len(self._join_callbacks.get(join_id) or ()),
+                                        self._initial_sync_received
+                                    )
                                 
                             # Analog Join
-                            elif (
-                                data[0] & 0b11001000 == 0b11000000
-                                and data[1] & 0b10000000 == 0b00000000
-                            ):
-                                data += await reader.read(2)
-                                header = struct.unpack("BBBB", data)
-                                join = ((header[0] & 0b00000111) << 7 | header[1]) + 1
-                                value = (
-                                    (header[0] & 0b00110000) << 10 | header[2] << 7 | header[3]
-                                )
-                                
+                            elif join_type == "a":
                                 # Only update if value changed
-                                join_state = self._analog[join]
-                                if join_state.value != value:
-                                    join_state.value = value
-                                    join_state.last_update = time.time()
-                                    join_state.update_count += 1
+                                if self._analog[join] != value:
+                                    self._analog[join] = value
                                     
-                                    await self._notify_callbacks(f"a{join}", str(value))
-                                    _LOGGER.debug("Received analog value: join=%d, value=%d", join, value)
+                                    await self._notify_callbacks(_ANALOG_IDS[join], str(value))
+                                    if debug:
+                                        _LOGGER.debug("Received analog value: join=%d, value=%d", join, value)
                                 
                             # Serial Join
-                            elif (
-                                data[0] & 0b11111000 == 0b11001000
-                                and data[1] & 0b10000000 == 0b00000000
-                            ):
-                                data += await reader.readuntil(b"\xff")
-                                header = struct.unpack("BB", data[:2])
-                                join = ((header[0] & 0b00000111) << 7 | header[1]) + 1
-                                string = data[2:-1].decode("utf-8")
-                                
+                            else:
                                 # Only update if value changed
-                                join_state = self._serial[join]
-                                if join_state.value != string:
-                                    join_state.value = string
-                                    join_state.last_update = time.time()
-                                    join_state.update_count += 1
+                                if self._serial.get(join, "") != value:
+                                    self._serial[join] = value
                                     
-                                    await self._notify_callbacks(f"s{join}", string)
-                                    _LOGGER.debug("Received serial value: join=%d, value=%s", join, string)
+                                    await self._notify_callbacks(_SERIAL_IDS[join], value)
+                                    if debug:
+                                        _LOGGER.debug("Received serial value: join=%d, value=%s", join, value)
                     else:
                         _LOGGER.info("Control system disconnected")
                         connected = False
                         self._available = False
-                        self._command_event.clear()
                         await self._notify_callbacks("system", "disconnected")
                         
                 except Exception as err:
                     _LOGGER.error("Error handling connection: %s", err)
                     connected = False
                     self._available = False
-                    self._command_event.clear()
                     await self._notify_callbacks("system", "disconnected")
                     
         except Exception as err:
@@ -479,11 +463,78 @@ class CrestronServer:
             self._writer = None
             self._reader = None
             self._available = False
-            self._command_event.clear()
             self._initial_sync_received = False
             self._initial_sync_event.clear()
             await self._notify_callbacks("system", "disconnected")
 
+    @staticmethod
+    def _tune_socket(sock) -> None:
+        """Disable Nagle and enlarge buffers for small, bursty join frames."""
+        if sock is None:
+            return
+        try:
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, SOCKET_BUFFER_SIZE)
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, SOCKET_BUFFER_SIZE)
+        except OSError as err:
+            _LOGGER.debug("Could not tune control system socket: %s", err)
+
+    def _parse_frames(self):
+        """Decode complete XSIG frames from the receive buffer.
+        
+        Yields (join_type, join, value) tuples and leaves any trailing
+        partial frame in the buffer for the next read.
+        """
+        buf = self._rxbuf
+        size = len(buf)
+        pos = 0
+        try:
+            while pos < size:
+                first = buf[pos]
+                
+                # Sync all joins request/response
+                if first == 0xFB:
+                    pos += 1
+                    yield "sync", 0, None
+                    continue
+                    
+                if pos + 1 >= size:
+                    break
+                second = buf[pos + 1]
+                if second & 0b10000000:
+                    # Not a frame header, resync on the next byte
+                    pos += 1
+                    continue
+                    
+                # Digital Join
+                if first & 0b11000000 == 0b10000000:
+                    pos += 2
+                    yield "d", ((first & 0b00011111) << 7 | second) + 1, ~first >> 5 & 0b1
+                    
+                # Analog Join
+                elif first & 0b11001000 == 0b11000000:
+                    if pos + 4 > size:
+                        break
+                    join = ((first & 0b00000111) << 7 | second) + 1
+                    value = (first & 0b00110000) << 10 | buf[pos + 2] << 7 | buf[pos + 3]
+                    pos += 4
+                    yield "a", join, value
+                    
+                # Serial Join
+                elif first & 0b11111000 == 0b11001000:
+                    end = buf.find(0xFF, pos + 2)
+                    if end == -1:
+                        break
+                    join = ((first & 0b00000111) << 7 | second) + 1
+                    start, pos = pos + 2, end + 1
+                    yield "s", join, buf[start:end].decode("utf-8")
+                    
+                else:
+                    pos += 1
+        finally:
+            # Drop consumed bytes in one go rather than per frame
+            del buf[:pos]
+
     async def get_analog(self, join: int) -> int | None:
         """Get analog value for join."""
         try:
@@ -491,8 +542,7 @@ class CrestronServer:
             if not self.available:
                 _LOGGER.debug("Cannot get analog value: server not available")
                 return None
-            join_state = self._analog[join]
-            return join_state.value
+            return self._analog[join]
         except Exception as err:
             _LOGGER.error("Error getting analog value: %s", err)
             return None
@@ -512,64 +562,54 @@ class CrestronServer:
             if not self._check_rate_limit(join_id):
                 raise HomeAssistantError(f"Join {join_id} update rate exceeded")
                 
-            # Create command
-            async def send_command():
-                data = struct.pack(
-                    ">BBBB",
+            # Queue frame
+            await self._queue_frame(
+                join_id,
+                _ANALOG_FRAME.pack(
                     0b11000000 | (value >> 10 & 0b00110000) | (join - 1) >> 7,
                     (join - 1) & 0b01111111,
                     value >> 7 & 0b01111111,
                     value & 0b01111111,
-                )
-                self._writer.write(data)
-                await self._writer.drain()
-                _LOGGER.debug("Sent analog value: join=%d, value=%d", join, value)
-                
-                # Update state
-                join_state = self._analog[join]
-                join_state.value = value
-                join_state.last_update = time.time()
-                join_state.update_count += 1
+                ),
+            )
+            _LOGGER.debug("Queued analog value: join=%d, value=%d", join, value)
             
-            # Queue command
-            await self._command_queue.put(send_command)
+            # Update state with the 16 bits that went on the wire
+            self._analog[join] = value & 0xFFFF
             
         except Exception as err:
             raise ConnectionError(f"Failed to send analog value: {err}") from err
 
     def register_callback(self, join_id: str, callback: Callable[[Any], None]) -> Callable[[], None]:
         """Register callback for updates."""
-        with self._callback_lock:
+        is_coro = asyncio.iscoroutinefunction(callback)
+        if join_id == "system":
+            self._global_callbacks[callback] = is_coro
+        else:
+            # Add callback to the table for this join
+            self._join_callbacks[join_id][callback] = is_coro
+        
+        def unregister():
             if join_id == "system":
-                self._global_callbacks.add(callback)
+                self._global_callbacks.pop(callback, None)
             else:
-                # Add callback to the set for this join
-                if join_id not in self._join_callbacks:
-                    self._join_callbacks[join_id] = set()
-                self._join_callbacks[join_id].add(callback)
-            
-            def unregister():
-                with self._callback_lock:
-                    if join_id == "system":
-                        self._global_callbacks.discard(callback)
-                    else:
-                        if join_id in self._join_callbacks:
-                            self._join_callbacks[join_id].discard(callback)
-                            if not self._join_callbacks[join_id]:
-                                del self._join_callbacks[join_id]
-            
-            return unregister
+                if join_id in self._join_callbacks:
+                    self._join_callbacks[join_id].pop(callback, None)
+                    if not self._join_callbacks[join_id]:
+                        del self._join_callbacks[join_id]
+        
+        return unregister
 
     def unregister_callback(self, join_id: str, callback: Callable[[Any], None]) -> None:
         """Remove callback."""
         _LOGGER.debug("Unregistering callback for %s", join_id)
         
         if join_id == "system":
-            self._global_callbacks.discard(callback)
+            self._global_callbacks.pop(callback, None)
             _LOGGER.debug("Removed global callback")
         else:
             if join_id in self._join_callbacks:
-                self._join_callbacks[join_id].discard(callback)
+                self._join_callbacks[join_id].pop(callback, None)
                 # Remove the join_id if no callbacks left
                 if not self._join_callbacks[join_id]:
                     del self._join_callbacks[join_id]
@@ -578,34 +618,40 @@ class CrestronServer:
     async def _notify_callbacks(self, join_id: str, value: Any) -> None:
         """Notify callbacks of join updates."""
         try:
-            callbacks = []
-            
-            # Get callbacks for this join under lock
-            with self._callback_lock:
-                if join_id in self._join_callbacks:
-                    callbacks.extend(list(self._join_callbacks[join_id]))
-                
-                # Include global callbacks for system events
-                if join_id == "system":
-                    callbacks.extend(list(self._global_callbacks))
+            if join_id == "system":
+                # Connection events can make entities (un)register callbacks,
+                # so dispatch from a snapshot that includes global callbacks
+                callbacks = [
+                    *self._join_callbacks.get(join_id, {}).items(),
+                    *self._global_callbacks.items(),
+                ]
+            else:
+                # Snapshot so a callback may (un)register on this join mid-dispatch
+                join_callbacks = self._join_callbacks.get(join_id)
+                if not join_callbacks:
+                    return
+                callbacks = tuple(join_callbacks.items())
             
-            # Create tasks for callbacks
-            tasks = []
-            for callback in callbacks:
+            # Run sync callbacks inline; coroutines start eagerly and only
+            # become pending tasks if they actually suspend
+            tasks = None
+            for callback, is_coro in callbacks:
                 try:
-                    if asyncio.iscoroutinefunction(callback):
-                        task = asyncio.create_task(callback(value))
+                    if is_coro:
+                        task = create_eager_task(callback(value))
+                        if not task.done():
+                            if tasks is None:
+                                tasks = []
+                            tasks.append(task)
+                        elif not task.cancelled() and task.exception() is not None:
+                            _LOGGER.error("Error executing callback for %s: %s", join_id, task.exception())
                     else:
                         callback(value)
-                        task = None
-                    
-                    if task:
-                        tasks.append(task)
                         
                 except Exception as err:
                     _LOGGER.error("Error executing callback for %s: %s", join_id, err)
             
-            # Wait for callbacks with timeout
+            # Wait for suspended callbacks with timeout
             if tasks:
                 try:
                     await asyncio.wait_for(asyncio.gather(*tasks), timeout=MAX_CALLBACK_TIME)
@@ -617,16 +663,6 @@ class CrestronServer:
         except Exception as err:
             _LOGGER.error("Error notifying callbacks: %s", err)
 
-    async def _run_callback(self, callback: Callable, value: Any) -> None:
-        """Run a single callback with error handling."""
-        try:
-            if asyncio.iscoroutinefunction(callback):
-                await callback(value)
-            else:
-                callback(value)
-        except Exception as err:
-            _LOGGER.error("Error in callback: %s", err)
-
     async def get_digital(self, join: int) -> bool:
         """Get digital value for join."""
         try:
@@ -634,8 +670,7 @@ class CrestronServer:
             if not self.available:
                 _LOGGER.debug("Cannot get digital value: server not available")
                 return False
-            join_state = self._digital[join]
-            return join_state.value or False
+            return bool(self._digital[join])
         except Exception as err:
             _LOGGER.error("Error getting digital value: %s", err)
             return False
@@ -655,33 +690,51 @@ class CrestronServer:
             if not self._check_rate_limit(join_id):
                 raise HomeAssistantError(f"Join {join_id} update rate exceeded")
                 
-            # Create command
-            async def send_command():
-                data = struct.pack(
-                    ">BB",
-                    0b10000000 | (~value << 5 & 0b00100000) | (join - 1) >> 7,
-                    (join - 1) & 0b01111111,
-                )
-                self._writer.write(data)
-                await self._writer.drain()
-                _LOGGER.debug("Sent digital value: join=%d, value=%s", join, value)
-                
-                # Don't update state here - wait for response from Crestron
-            
-            # Queue command
-            await self._command_queue.put(send_command)
+            # Queue frame - don't update state here, wait for response from Crestron
+            await self._queue_frame(next(self._frame_seq), _DIGITAL_FRAMES[(join - 1) << 1 | bool(value)])
+            _LOGGER.debug("Queued digital value: join=%d, value=%s", join, value)
             
         except Exception as err:
             raise ConnectionError(f"Failed to send digital value: {err}") from err
 
+    async def pulse_digital(self, join: int, duration: float) -> None:
+        """Send a digital press to Crestron and release it after duration seconds."""
+        try:
+            self._validate_join(join, "d")
+            if not self.available:
+                raise ConnectionError("Server not available")
+                
+            if not self._writer:
+                raise ConnectionError("No connection to Crestron system")
+                
+            # Check rate limit
+            join_id = f"d{join}"
+            if not self._check_rate_limit(join_id):
+                raise HomeAssistantError(f"Join {join_id} update rate exceeded")
+                
+            # Queue press now, release is queued behind it from the loop
+            await self._queue_frame(next(self._frame_seq), _DIGITAL_FRAMES[(join - 1) << 1 | 1])
+            self.hass.loop.call_later(duration, self._queue_release_frame, join)
+            _LOGGER.debug("Queued digital pulse: join=%d, duration=%.3fs", join, duration)
+            
+        except Exception as err:
+            raise ConnectionError(f"Failed to send digital pulse: {err}") from err
+
+    def _queue_release_frame(self, join: int) -> None:
+        """Queue the release frame for a pulsed digital join."""
+        if self._writer is None or self._writer.is_closing():
+            _LOGGER.debug("Dropping release for join d%d, connection closed", join)
+            return
+        # Never held back by the batch limit, a dropped release leaves the join pressed
+        self._put_frame(next(self._frame_seq), _DIGITAL_FRAMES[(join - 1) << 1])
+
     async def get_serial(self, join: int) -> str:
         """Get serial value for join."""
         try:
             if not self.available:
                 _LOGGER.debug("Cannot get serial value: server not available")
                 return ""
-            join_state = self._serial[join]
-            return join_state.value or ""
+            return self._serial.get(join, "")
         except Exception as err:
             _LOGGER.error("Error getting serial value: %s", err)
             return ""
@@ -703,29 +756,37 @@ class CrestronServer:
             if not self._check_rate_limit(join_id):
                 raise HomeAssistantError(f"Join {join_id} update rate exceeded")
                 
-            # Create command
-            async def send_command():
-                data = struct.pack(
-                    ">BB", 0b11001000 | ((join - 1) >> 7), (join - 1) & 0b01111111
-                )
-                data += string.encode()
-                data += b"\xff"
-                self._writer.write(data)
-                await self._writer.drain()
-                _LOGGER.debug("Sent serial value: join=%d, value=%s", join, string)
-                
-                # Update state
-                join_state = self._serial[join]
-                join_state.value = string
-                join_state.last_update = time.time()
-                join_state.update_count += 1
+            # Queue frame
+            await self._queue_frame(
+                join_id,
+                b"".join((
+                    _JOIN_HEADER.pack(0b11001000 | ((join - 1) >> 7), (join - 1) & 0b01111111),
+                    string.encode(),
+                    b"\xff",
+                )),
+            )
+            _LOGGER.debug("Queued serial value: join=%d, value=%s", join, string)
             
-            # Queue command
-            await self._command_queue.put(send_command)
+            # Update state
+            self._serial[join] = string
             
         except Exception as err:
             raise ConnectionError(f"Failed to send serial value: {err}") from err
 
+    def _reset_join_states(self) -> None:
+        """Reset join state to defaults, one dense slot per join."""
+        self._digital = array("B", bytes(MAX_DIGITAL_JOIN + 1))
+        self._analog = array("H", bytes(2 * (MAX_ANALOG_JOIN + 1)))
+        self._serial = {}
+
+    def snapshot_join_states(self) -> dict[str, dict[int, Any]]:
+        """Return a copy of the joins that currently hold a non-default value."""
+        return {
+            "digital": {join: True for join, value in enumerate(self._digital) if value},
+            "analog": {join: value for join, value in enumerate(self._analog) if value},
+            "serial": {join: value for join, value in self._serial.items() if value},
+        }
+
     def register_sync_all_joins_callback(self, callback: Callable) -> None:
         """Register callback for when control system requests all joins update."""
         _LOGGER.debug("Registering sync-all-joins callback")
@@ -93,6 +93,11 @@ class CrestronButtonLED(CrestronEntity[bool], SwitchEntity):
         """Register callbacks when entity is added."""
         await super().async_added_to_hass()
         
+        # Let LED binding selects drive this LED directly by entry and join
+        self.hass.data[DOMAIN].setdefault("led_entities", {})[
+            (self._server.entry_id, self._join)
+        ] = self
+        
         try:
             # For output-only entities, we don't need to request initial state
             # Just mark as available when server is connected
@@ -122,6 +127,13 @@ class CrestronButtonLED(CrestronEntity[bool], SwitchEntity):
             )
             self._attr_available = False
 
+    async def _platform_will_remove_from_hass(self) -> None:
+        """Unregister the LED from binding selects."""
+        led_entities = self.hass.data[DOMAIN].get("led_entities", {})
+        key = (self._server.entry_id, self._join)
+        if led_entities.get(key) is self:
+            del led_entities[key]
+
     @callback
     def _handle_update(self, value: str) -> None:
         """Handle updates from server."""